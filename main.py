@@ -2,8 +2,10 @@
 """Main orchestrator for podcast monitoring and summarization."""
 
 import sys
+import json
+import hashlib
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 from src.config_loader import ConfigLoader
@@ -60,7 +62,9 @@ def main():
     # Initialize components
     rss_parser = RSSParser(max_audio_length_minutes=max_audio_length_minutes)
     downloader = Downloader(max_file_size_mb=max_audio_file_size_mb)
-    contextualizer = Contextualizer()
+    contextualizer = Contextualizer(
+        service_tier=config_loader.get_setting('contextualize_service_tier', 'flex')
+    )
     transcriber = Transcriber(api_key=config_loader.env_vars['ASSEMBLYAI_API_KEY'])
     summarizer = Summarizer()
     emailer = Emailer(system_email=system_email, reply_to_email=config_loader.get_setting('reply_to_email'))
@@ -73,6 +77,29 @@ def main():
     active_podcasts = db.get_active_podcasts()
     logger.info(f"Found {len(active_podcasts)} active podcasts")
 
+    # Fetch all RSS feeds concurrently up front
+    feed_config_hashes = {
+        podcast_lookup[p['slug']]['rss_url']: feed_config_hash(
+            podcast_lookup[p['slug']], check_last_n_episodes,
+            max_episode_age_days, max_audio_length_minutes
+        )
+        for p in active_podcasts if p['slug'] in podcast_lookup
+    }
+    rss_urls = list(feed_config_hashes)
+    logger.info(f"Fetching {len(rss_urls)} RSS feeds...")
+    feed_validators = {}
+    for url in rss_urls:
+        stored = db.get_feed_validators(url)
+        # A 304 would skip episodes the new config may now want (more
+        # episodes, new recipients), so refetch fully after config changes
+        if stored and stored['config_hash'] == feed_config_hashes[url]:
+            feed_validators[url] = stored
+    prefetched_feeds = rss_parser.fetch_episodes_many(
+        rss_urls,
+        check_last_n=check_last_n_episodes,
+        validators=feed_validators
+    )
+
     has_failures = False
     for podcast in active_podcasts:
         try:
@@ -87,11 +114,20 @@ def main():
                 summarizer=summarizer,
                 emailer=emailer,
                 check_last_n_episodes=check_last_n_episodes,
+                prefetched_feeds=prefetched_feeds,
                 max_episode_age_days=max_episode_age_days,
                 default_prompt=default_prompt,
                 system_prompt=system_prompt,
                 contextualize_prompt=contextualize_prompt
             )
+
+            # Remember cache validators only once the feed was fully processed,
+            # so an unchanged feed is skipped next run but a failed one is retried
+            rss_url = podcast_lookup[podcast['slug']]['rss_url']
+            validators = rss_parser.feed_validators.get(rss_url)
+            if validators:
+                db.update_feed_validators(rss_url, validators['etag'], validators['last_modified'],
+                                          feed_config_hashes[rss_url])
         except Exception as e:
             logger.error(f"Error processing podcast {podcast['slug']}: {e}")
             has_failures = True
@@ -119,9 +155,32 @@ def main():
         return 0
 
 
+def feed_config_hash(podcast_config, check_last_n_episodes, max_episode_age_days,
+                     max_audio_length_minutes):
+    """Hash the config that decides which of a feed's episodes get processed.
+
+    Args:
+        podcast_config: Podcast configuration from podcasts.yaml
+        check_last_n_episodes: Number of episodes to check
+        max_episode_age_days: Skip episodes older than this (in days)
+        max_audio_length_minutes: Skip episodes longer than this
+
+    Returns:
+        Hex digest that changes whenever any of the inputs change
+    """
+    relevant = {
+        'podcast': podcast_config,
+        'check_last_n_episodes': check_last_n_episodes,
+        'max_episode_age_days': max_episode_age_days,
+        'max_audio_length_minutes': max_audio_length_minutes,
+    }
+    return hashlib.sha256(json.dumps(relevant, sort_keys=True, default=str).encode()).hexdigest()
+
+
 def process_podcast(podcast, podcast_config, db, rss_parser, downloader,
                    contextualizer, transcriber, summarizer, emailer, check_last_n_episodes,
-                   max_episode_age_days, default_prompt, system_prompt, contextualize_prompt):
+                   max_episode_age_days, default_prompt, system_prompt, contextualize_prompt,
+                   prefetched_feeds=None):
     """Process a single podcast.
 
     Args:
@@ -139,19 +198,33 @@ def process_podcast(podcast, podcast_config, db, rss_parser, downloader,
         default_prompt: Default summarization prompt
         system_prompt: System prompt for LLM
         contextualize_prompt: Default contextualize prompt
+        prefetched_feeds: Optional results of RSSParser.fetch_episodes_many,
+                          keyed by RSS URL
     """
     slug = podcast['slug']
     logger.info(f"Processing podcast: {slug}")
 
-    # Fetch RSS feed
-    logger.info(f"Fetching RSS feed for {slug}...")
-    episodes, podcast_metadata = rss_parser.fetch_episodes(
-        podcast_config['rss_url'],
-        check_last_n=check_last_n_episodes
-    )
+    # Fetch RSS feed (unless it was already fetched concurrently)
+    rss_url = podcast_config['rss_url']
+    if prefetched_feeds and rss_url in prefetched_feeds:
+        feed_result = prefetched_feeds[rss_url]
+        if isinstance(feed_result, Exception):
+            raise feed_result
+        episodes, podcast_metadata = feed_result
+    else:
+        logger.info(f"Fetching RSS feed for {slug}...")
+        episodes, podcast_metadata = rss_parser.fetch_episodes(
+            rss_url,
+            check_last_n=check_last_n_episodes
+        )
 
     # Update last_checked timestamp and metadata after successful fetch
     db.update_podcast_last_checked(podcast['id'])
+
+    if rss_url in rss_parser.not_modified:
+        logger.info(f"Feed unchanged since last run for {slug}, skipping")
+        return
+
     if podcast_metadata:
         db.update_podcast_metadata(podcast['id'], podcast_metadata)
 
@@ -237,9 +310,11 @@ def process_episode(episode_data, podcast, podcast_config, podcast_metadata, db,
     if published_date_str:
         try:
             published_date = datetime.fromisoformat(published_date_str.replace('Z', '+00:00'))
-            # Remove timezone info for comparison (compare dates only)
-            published_date = published_date.replace(tzinfo=None)
-            now = datetime.now()
+            if published_date.tzinfo:
+                # Compare timezone-aware dates in UTC
+                now = datetime.now(timezone.utc)
+            else:
+                now = datetime.now()
             age_days = (now - published_date).days
 
             if age_days > max_episode_age_days:
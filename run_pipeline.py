@@ -93,7 +93,9 @@ class PipelineCLI:
         self.downloader = Downloader(
             max_file_size_mb=settings.get('max_audio_file_size_mb', 500)
         )
-        self.contextualizer = Contextualizer()
+        self.contextualizer = Contextualizer(
+            service_tier=settings.get('contextualize_service_tier', 'flex')
+        )
         self.transcriber = Transcriber(
             api_key=self.config_loader.env_vars['ASSEMBLYAI_API_KEY']
         )
@@ -521,7 +523,8 @@ def transcribe(episode_id, audio_path, podcast):
 @click.option('--transcript-path', type=click.Path(exists=True), help='Direct path to transcript file')
 @click.option('--podcast', help='Podcast slug (required if using --transcript-path)')
 @click.option('--prompt', help='Custom summarization prompt (optional)')
-def summarize(episode_id, transcript_path, podcast, prompt):
+@click.option('--force', is_flag=True, help='Ignore cached LLM responses and regenerate the summary')
+def summarize(episode_id, transcript_path, podcast, prompt, force):
     """Summarize a transcript.
 
     You can either summarize a transcript from an episode in the database
@@ -541,6 +544,9 @@ def summarize(episode_id, transcript_path, podcast, prompt):
 
       # Test different prompts
       $ uv run run_pipeline.py summarize --episode-id 123 --prompt "Extract key business decisions and market trends"
+
+      # Regenerate instead of reusing a cached summary (e.g. after changing model settings)
+      $ uv run run_pipeline.py summarize --episode-id 123 --force
     """
     try:
         cli_context.initialize()
@@ -588,7 +594,8 @@ def summarize(episode_id, transcript_path, podcast, prompt):
                 podcast,
                 filename,
                 podcast_metadata=podcast_metadata,
-                system_prompt=system_prompt
+                system_prompt=system_prompt,
+                force=force
             )
 
             if summary_path:
@@ -660,7 +667,8 @@ def summarize(episode_id, transcript_path, podcast, prompt):
             filename,
             context=context,
             podcast_metadata=podcast_metadata,
-            system_prompt=system_prompt
+            system_prompt=system_prompt,
+            force=force
         )
 
         if summary_path:
@@ -1,16 +1,23 @@
 """Configuration loader and validator."""
 
+import io
 import os
 import re
 import sys
 import yaml
 import logging
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, TextIO, Union
 from dotenv import load_dotenv
 
 logger = logging.getLogger(__name__)
 
+# libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
 
 class ConfigError(Exception):
     """Configuration validation error."""
@@ -21,10 +28,13 @@ class ConfigLoader:
     """Load and validate all configuration files."""
 
     def __init__(self,
-                 podcasts_yaml: str = "podcasts.yaml",
-                 config_yaml: str = "config.yaml",
-                 env_file: str = ".env"):
-        """Initialize config loader."""
+                 podcasts_yaml: Union[str, TextIO] = "podcasts.yaml",
+                 config_yaml: Union[str, TextIO] = "config.yaml",
+                 env_file: Union[str, TextIO] = ".env"):
+        """Initialize config loader.
+
+        Each source is a file path or an already-open text stream.
+        """
         self.podcasts_yaml = podcasts_yaml
         self.config_yaml = config_yaml
         self.env_file = env_file
@@ -33,6 +43,29 @@ class ConfigLoader:
         self.app_config: Dict[str, Any] = {}
         self.env_vars: Dict[str, str] = {}
 
+    @classmethod
+    def from_strings(cls, podcasts_yaml: str, config_yaml: str,
+                     env_text: str = "") -> "ConfigLoader":
+        """Create a loader that reads its configuration from in-memory text.
+
+        Args:
+            podcasts_yaml: Contents of podcasts.yaml
+            config_yaml: Contents of config.yaml
+            env_text: Contents of .env
+
+        Returns:
+            ConfigLoader reading from the given strings
+        """
+        return cls(io.StringIO(podcasts_yaml), io.StringIO(config_yaml),
+                   io.StringIO(env_text))
+
+    @staticmethod
+    def _open(source: Union[str, TextIO]):
+        """Open a config source, passing streams through unchanged."""
+        if hasattr(source, 'read'):
+            return nullcontext(source)
+        return open(source, 'r')
+
     def load_all(self) -> bool:
         """Load and validate all configurations.
 
@@ -52,7 +85,10 @@ class ConfigLoader:
 
     def _load_env(self):
         """Load environment variables from .env file."""
-        if Path(self.env_file).exists():
+        if hasattr(self.env_file, 'read'):
+            load_dotenv(stream=self.env_file)
+            logger.info("Loaded environment from stream")
+        elif Path(self.env_file).exists():
             load_dotenv(self.env_file)
             logger.info(f"Loaded environment from {self.env_file}")
         else:
@@ -69,9 +105,9 @@ class ConfigLoader:
     def _load_podcasts_config(self):
         """Load podcasts.yaml configuration."""
         try:
-            with open(self.podcasts_yaml, 'r') as f:
-                data = yaml.safe_load(f)
-                # Handle empty YAML files (yaml.safe_load returns None)
+            with self._open(self.podcasts_yaml) as f:
+                data = yaml.load(f, Loader=_YAML_LOADER)
+                # Handle empty YAML files (the loader returns None)
                 if data is None:
                     data = {}
                 self.podcasts_config = data.get('podcasts', [])
@@ -84,9 +120,9 @@ class ConfigLoader:
     def _load_app_config(self):
         """Load config.yaml configuration."""
         try:
-            with open(self.config_yaml, 'r') as f:
-                self.app_config = yaml.safe_load(f)
-                # Handle empty YAML files (yaml.safe_load returns None)
+            with self._open(self.config_yaml) as f:
+                self.app_config = yaml.load(f, Loader=_YAML_LOADER)
+                # Handle empty YAML files (the loader returns None)
                 if self.app_config is None:
                     self.app_config = {}
             logger.info(f"Loaded application config from {self.config_yaml}")
@@ -224,8 +260,7 @@ class ConfigLoader:
     @staticmethod
     def _is_valid_email(email: str) -> bool:
         """Basic email format validation."""
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(pattern, email))
+        return bool(_EMAIL_RE.match(email))
 
     def get_podcasts(self) -> List[Dict[str, Any]]:
         """Get podcasts configuration."""
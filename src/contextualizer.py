@@ -6,6 +6,7 @@ from datetime import datetime
 
 # Use OpenAI GPT-5-mini for fast, cheap contextualization
 from src.llm import openai as llm_provider
+from src.llm.cache import ResponseCache
 
 logger = logging.getLogger(__name__)
 
@@ -13,14 +14,25 @@ logger = logging.getLogger(__name__)
 class Contextualizer:
     """Extract context from episode metadata before transcription."""
 
-    def __init__(self):
+    def __init__(self, cache_path: Optional[str] = "data/cache/llm_responses.db",
+                 service_tier: Optional[str] = "flex"):
         """Initialize contextualizer.
 
         Uses OpenAI GPT-5-mini for fast, cheap context extraction with low reasoning effort.
+
+        Args:
+            cache_path: LLM response cache file (None to disable)
+            service_tier: OpenAI processing tier; "flex" (default) trades
+                          latency for batch pricing, None uses the default tier
         """
+        self.cache = ResponseCache(cache_path) if cache_path else None
+
         # Use fast, cheap model for metadata extraction
         self.model = "gpt-5-mini"
         self.reasoning_effort = "medium"
+        # Context is not latency-critical, so use flex processing by default
+        # (batch pricing without the Batch API's asynchronous submit/poll cycle)
+        self.service_tier = service_tier
 
     def contextualize_episode(self,
                               podcast_name: str,
@@ -83,7 +95,9 @@ class Contextualizer:
             # Create provider instance
             provider = llm_provider.OpenAIProvider(
                 model=self.model,
-                reasoning_effort=self.reasoning_effort
+                reasoning_effort=self.reasoning_effort,
+                service_tier=self.service_tier,
+                cache=self.cache
             )
 
             # Generate context
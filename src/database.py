@@ -154,6 +154,18 @@ class Database:
             ON email_log(episode_id, recipient_email)
         """)
 
+        # feed_cache table (HTTP cache validators per RSS feed, plus a hash of
+        # the podcast config they were stored under)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS feed_cache (
+                rss_url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                config_hash TEXT,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
         # Create indexes for podcasts table
         # Index for get_active_podcasts() - queries by active status
         cursor.execute("""
@@ -246,6 +258,41 @@ class Database:
         """, (json.dumps(metadata), podcast_id))
         self.conn.commit()
 
+    @require_connection
+    def get_feed_validators(self, rss_url: str) -> Optional[Dict[str, Any]]:
+        """Get stored ETag/Last-Modified validators and config hash for an RSS feed."""
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT etag, last_modified, config_hash FROM feed_cache WHERE rss_url = ?
+        """, (rss_url,))
+        row = cursor.fetchone()
+        return dict(row) if row else None
+
+    @require_connection
+    def update_feed_validators(self, rss_url: str, etag: Optional[str],
+                               last_modified: Optional[str],
+                               config_hash: Optional[str] = None):
+        """Store ETag/Last-Modified validators for an RSS feed.
+
+        Args:
+            rss_url: RSS feed URL
+            etag: ETag response header (or None)
+            last_modified: Last-Modified response header (or None)
+            config_hash: Hash of the podcast config the feed was processed
+                         with, so a config change can force a full fetch
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            INSERT INTO feed_cache (rss_url, etag, last_modified, config_hash, updated_at)
+            VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT(rss_url) DO UPDATE SET
+                etag = excluded.etag,
+                last_modified = excluded.last_modified,
+                config_hash = excluded.config_hash,
+                updated_at = CURRENT_TIMESTAMP
+        """, (rss_url, etag, last_modified, config_hash))
+        self.conn.commit()
+
     @require_connection
     def episode_exists(self, episode_guid: str) -> bool:
         """Check if episode exists by GUID."""
@@ -427,6 +474,34 @@ class Database:
         latest = self.get_latest_processing_event(episode_id)
         return latest['status'] if latest else None
 
+    @require_connection
+    def get_statuses_bulk(self, episode_ids: List[int]) -> Dict[int, str]:
+        """Get the current processing status for several episodes in one query.
+
+        Args:
+            episode_ids: Episode IDs to look up
+
+        Returns:
+            Dict mapping episode_id to status; episodes without events are omitted
+        """
+        if not episode_ids:
+            return {}
+
+        placeholders = ', '.join('?' * len(episode_ids))
+        cursor = self.conn.cursor()
+        cursor.execute(f"""
+            SELECT episode_id, status FROM (
+                SELECT episode_id, status,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY episode_id ORDER BY created_at DESC, id DESC
+                       ) AS rn
+                FROM processing_events
+                WHERE episode_id IN ({placeholders})
+            )
+            WHERE rn = 1
+        """, list(episode_ids))
+        return {row['episode_id']: row['status'] for row in cursor.fetchall()}
+
     @require_connection
     def get_event_data(self, episode_id: int, status: str) -> Optional[Dict[str, Any]]:
         """Get event_data from the latest event of a specific status.
@@ -446,10 +521,12 @@ class Database:
         """Check if email already sent to recipient for episode."""
         cursor = self.conn.cursor()
         cursor.execute("""
-            SELECT 1 FROM email_log
-            WHERE episode_id = ? AND recipient_email = ?
+            SELECT EXISTS(
+                SELECT 1 FROM email_log
+                WHERE episode_id = ? AND recipient_email = ?
+            )
         """, (episode_id, recipient))
-        return cursor.fetchone() is not None
+        return bool(cursor.fetchone()[0])
 
     @require_connection
     def log_email_sent(self, episode_id: int, recipient: str):
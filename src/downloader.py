@@ -7,11 +7,33 @@ import logging
 import requests
 import shutil
 from pathlib import Path
+from functools import lru_cache
 from typing import Optional
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Filename sanitization: drop anything but alphanumerics, whitespace and hyphens,
+# then collapse separator runs into one hyphen
+_SPECIAL_CHARS_RE = re.compile(r'[^a-zA-Z0-9\s-]')
+_SEPARATOR_RE = re.compile(r'[\s-]+')
+
+
+@lru_cache(maxsize=1024)
+def _slugify_title(title: str, max_length: int) -> str:
+    """Turn an episode title into a lowercase hyphenated slug.
+
+    Cached: the same titles are slugified repeatedly across pipeline stages.
+    Only the title part is cached, since the date prefix can depend on the
+    current date.
+    """
+    # Remove special characters, keep alphanumeric and spaces
+    clean_title = _SPECIAL_CHARS_RE.sub('', title)
+    # Replace runs of spaces/hyphens with a single hyphen
+    clean_title = _SEPARATOR_RE.sub('-', clean_title)
+    # Lowercase, strip leading/trailing hyphens and limit length
+    return clean_title.lower().strip('-')[:max_length]
+
 
 class Downloader:
     """Download podcast audio files."""
@@ -190,25 +212,13 @@ class Downloader:
         if not date_prefix:
             # Fallback to hash of GUID for deterministic naming
             if episode_guid:
-                hash_prefix = hashlib.sha256(episode_guid.encode()).hexdigest()[:8]
+                hash_prefix = hashlib.sha256(episode_guid.encode()).digest()[:4].hex()
                 date_prefix = hash_prefix
             else:
                 # Last resort: use today's date
                 date_prefix = datetime.now().strftime("%Y%m%d")
 
-        # Sanitize title
-        # Remove special characters, keep alphanumeric and spaces
-        clean_title = re.sub(r'[^a-zA-Z0-9\s-]', '', title)
-        # Replace spaces with hyphens
-        clean_title = re.sub(r'\s+', '-', clean_title)
-        # Remove multiple hyphens
-        clean_title = re.sub(r'-+', '-', clean_title)
-        # Convert to lowercase
-        clean_title = clean_title.lower()
-        # Strip leading/trailing hyphens
-        clean_title = clean_title.strip('-')
-        # Limit length
-        clean_title = clean_title[:max_length]
+        clean_title = _slugify_title(title, max_length)
 
         # Construct filename
         filename = f"{date_prefix}-{clean_title}.mp3"
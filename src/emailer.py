@@ -1,13 +1,232 @@
 """Email service using Resend."""
 
 import os
+import re
+import html
+import uuid
+import time
+import random
 import logging
+import threading
+from datetime import datetime
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
+import requests
+from requests.adapters import HTTPAdapter
 import resend
 import markdown2
 
 logger = logging.getLogger(__name__)
 
+# markdown2 extras used for summary rendering (better list handling)
+_MARKDOWN_EXTRAS = ("cuddled-lists", "fenced-code-blocks", "tables")
+
+# Markdown converters are reused across calls (construction sets up the
+# extras); one per thread since convert() keeps per-document state
+_markdown_local = threading.local()
+
+
+def _get_markdown_converter() -> markdown2.Markdown:
+    """Get this thread's reusable markdown2 converter."""
+    converter = getattr(_markdown_local, 'converter', None)
+    if converter is None:
+        converter = markdown2.Markdown(extras=list(_MARKDOWN_EXTRAS))
+        _markdown_local.converter = converter
+    return converter
+
+
+# Anything markdown2 could treat as syntax (inline markup, escapes, HTML,
+# headers, lists, quotes, rules, tables, indented code, hard breaks).
+# Text without any of it renders as plain paragraphs.
+_MARKDOWN_SYNTAX_RE = re.compile(
+    r"[\\`*_#\[\]<>&|~\t\r]|^[ ]|^[-+=]|^\d+\.\s|[ ]{2,}$",
+    re.MULTILINE
+)
+
+
+def _render_plain_paragraphs(text: str) -> str:
+    """Render markdown-free text the way markdown2 would, without parsing."""
+    paragraphs = [p.strip("\n") for p in text.split("\n\n")]
+    paragraphs = [p for p in paragraphs if p] or [""]
+    return "\n\n".join(f"<p>{p}</p>" for p in paragraphs) + "\n"
+
+
+@lru_cache(maxsize=256)
+def _render_markdown(text: str) -> str:
+    """Convert markdown to HTML, caching results for repeated summaries.
+
+    The same summary is rendered once per recipient and again on retries,
+    so identical inputs are served from the cache instead of re-parsed.
+    Plain-text summaries skip the markdown parser entirely.
+    """
+    if not _MARKDOWN_SYNTAX_RE.search(text):
+        return _render_plain_paragraphs(text)
+    return str(_get_markdown_converter().convert(text))
+
+
+# Summary email layout, a module constant rather than a string rebuilt per
+# email (str.format still parses it on each call). All fields are substituted
+# pre-escaped (RSS metadata) or pre-rendered (summary markdown).
+_SUMMARY_HTML_TEMPLATE = (
+    "<html><body style='font-family: Arial, sans-serif;'>"
+    "{img_block}"
+    "<h2 style='margin-bottom: 8px;'>{title}</h2>"
+    "<div style='font-size: 0.85em; color: #666; margin-bottom: 16px;'>"
+    "{podcast_block}{date_block}"
+    "</div>"
+    "<p><a href='{episode_link}'>Listen to episode</a>{duration_text}</p>"
+    "<hr>"
+    "<div style='margin-top: 20px;'>{summary_html}</div>"
+    "</body></html>"
+)
+_IMAGE_HTML_TEMPLATE = ("<img src='{url}' alt='Episode artwork' "
+                        "style='max-width: 250px; margin-bottom: 20px;'><br>")
+_PODCAST_LINK_HTML_TEMPLATE = ("<a href='{url}' "
+                               "style='color: #666; text-decoration: none;'>{name}</a>")
+
+
+# Retry settings for transient Resend failures. A 502/504 can arrive after
+# Resend has already accepted the send, so every attempt carries the same
+# idempotency key and Resend drops the duplicate instead of delivering twice.
+_RETRYABLE_STATUS_CODES = {429, 502, 503, 504}
+_NON_RETRYABLE_ERROR_TYPES = {"daily_quota_exceeded", "monthly_quota_exceeded"}
+_MAX_SEND_ATTEMPTS = 3
+_RETRY_INITIAL_DELAY = 1.0
+_RETRY_MAX_DELAY = 30.0
+
+# Resend accepts at most 100 emails per batch request
+_BATCH_LIMIT = 100
+_SEND_WORKERS = 4
+
+
+class _SessionRequestsClient(resend.RequestsClient):
+    """Resend HTTP client that keeps connections alive between API calls.
+
+    The SDK's default client issues each request via requests.request(),
+    opening a new TCP/TLS connection every time; a shared Session reuses
+    pooled connections across sends and batch requests.
+    """
+
+    def __init__(self, timeout: int = 30):
+        super().__init__(timeout=timeout)
+        self._session = requests.Session()
+        # Size the pool for concurrent batch requests
+        adapter = HTTPAdapter(pool_maxsize=_SEND_WORKERS)
+        self._session.mount("https://", adapter)
+
+    def request(self, method, url, headers, json=None, files=None, data=None):
+        try:
+            resp = self._session.request(
+                method=method,
+                url=url,
+                headers=headers,
+                json=json if files is None and data is None else None,
+                files=files,
+                data=data,
+                timeout=self._timeout,
+            )
+            return resp.content, resp.status_code, resp.headers
+        except requests.RequestException as e:
+            # Surfaced by the SDK as a ResendError, like the default client
+            raise RuntimeError(f"Request failed: {e}") from e
+
+
+# Importing this module replaces the Resend SDK's process-wide HTTP client
+# with the pooled one, so every Resend call in the process reuses connections
+resend.default_http_client = _SessionRequestsClient()
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Check whether a Resend error is transient and worth retrying."""
+    if not isinstance(error, resend.exceptions.ResendError):
+        return False
+    if getattr(error, 'error_type', None) in _NON_RETRYABLE_ERROR_TYPES:
+        return False
+    try:
+        return int(error.code) in _RETRYABLE_STATUS_CODES
+    except (TypeError, ValueError):
+        return False
+
+
+def _retry_delay(error: Exception, attempt: int) -> float:
+    """Seconds to wait before the next attempt (Retry-After or backoff with jitter)."""
+    headers = getattr(error, 'headers', None) or {}
+    retry_after = {k.lower(): v for k, v in headers.items()}.get('retry-after')
+    if retry_after:
+        try:
+            return min(float(retry_after), _RETRY_MAX_DELAY)
+        except ValueError:
+            pass
+    backoff = _RETRY_INITIAL_DELAY * (2 ** (attempt - 1))
+    return min(backoff + random.uniform(0, _RETRY_INITIAL_DELAY), _RETRY_MAX_DELAY)
+
+
+def _send_with_retry(send, params):
+    """Call a Resend send function, retrying transient failures.
+
+    All attempts send the same idempotency key, so a retry after a send
+    that Resend actually accepted is not delivered again.
+
+    Args:
+        send: Resend API function (e.g. resend.Batch.send, resend.Emails.send)
+        params: Parameters to pass to the send function
+
+    Returns:
+        Response from the send function
+    """
+    # One key per logical send: stable across its retries, but a later
+    # deliberate re-send (e.g. the next run's error summary) is a new request
+    options = {"idempotency_key": f"podcast-summary-{uuid.uuid4().hex}"}
+    for attempt in range(1, _MAX_SEND_ATTEMPTS + 1):
+        try:
+            return send(params, options)
+        except Exception as e:
+            if attempt == _MAX_SEND_ATTEMPTS or not _is_retryable(e):
+                raise
+            delay = _retry_delay(e, attempt)
+            logger.warning("Resend request failed (%s); retrying in %.1fs (attempt %d/%d)",
+                           e, delay, attempt, _MAX_SEND_ATTEMPTS)
+            time.sleep(delay)
+
+
+@lru_cache(maxsize=128)
+def _format_duration(duration_minutes: Optional[int]) -> str:
+    """Format duration in minutes to human-readable string."""
+    if not duration_minutes:
+        return ""
+
+    if duration_minutes < 60:
+        return f"{duration_minutes} min"
+
+    hours = duration_minutes // 60
+    minutes = duration_minutes % 60
+    if minutes == 0:
+        return f"{hours}h"
+    return f"{hours}h {minutes}m"
+
+
+@lru_cache(maxsize=1024)
+def _format_published_date(published_date: str) -> str:
+    """Format published date to human-readable string.
+
+    Cached since each email formats the same date for both HTML and text bodies.
+    """
+    try:
+        # Parse ISO format date
+        dt = datetime.fromisoformat(published_date.replace('Z', '+00:00'))
+        # Format as "Mon DD, YYYY" (3-letter month)
+        # Check if time component exists (not midnight UTC)
+        if dt.hour != 0 or dt.minute != 0:
+            # Include time if present: "Dec 07, 2025 2:30 PM"
+            return dt.strftime("%b %d, %Y %I:%M %p")
+        else:
+            # Date only: "Dec 07, 2025"
+            return dt.strftime("%b %d, %Y")
+    except (ValueError, AttributeError):
+        # Return original if parsing fails
+        return published_date
+
 
 class Emailer:
     """Send emails via Resend."""
@@ -24,9 +243,24 @@ class Emailer:
         self.from_email = system_email
         self.reply_to_email = reply_to_email
 
-        # Configure Resend
+        # Sender and reply-to fields are fixed for the instance lifetime
+        self._from_summary = f"Podcast Summary <{system_email}>"
+        self._from_error = f"Podcast Summaries <{system_email}>"
+        self._reply_to = [reply_to_email] if reply_to_email else None
+
+        # Thread pool for concurrent batch requests (created on first use)
+        self._send_pool: Optional[ThreadPoolExecutor] = None
+
+        # Configure Resend (the pooled HTTP client is installed at import)
         resend.api_key = self.api_key
 
+    def _get_send_pool(self) -> ThreadPoolExecutor:
+        """Get the thread pool used to send batch requests concurrently."""
+        if self._send_pool is None:
+            self._send_pool = ThreadPoolExecutor(max_workers=_SEND_WORKERS,
+                                                 thread_name_prefix="resend-send")
+        return self._send_pool
+
     def send_summary_email(self, podcast_name: str, episode_title: str,
                           episode_link: str, image_url: Optional[str],
                           summary: str, recipients: List[str],
@@ -68,32 +302,46 @@ class Emailer:
         text_body = self._build_text_body(podcast_name, episode_title, final_episode_link,
                                           summary, duration_minutes, published_date, podcast_link)
 
-        # Build batch params - one email per recipient
-        batch_params = [
-            {
-                "from": f"Podcast Summary <{self.from_email}>",
-                "to": [recipient],
-                "subject": subject,
-                "html": html_body,
-                "text": text_body,
-                **({"reply_to": [self.reply_to_email]} if self.reply_to_email else {})
-            }
-            for recipient in recipients
-        ]
+        # Build batch params - one email per recipient, sharing the common fields
+        base_params = {
+            "from": self._from_summary,
+            "subject": subject,
+            "html": html_body,
+            "text": text_body,
+        }
+        if self._reply_to:
+            base_params["reply_to"] = self._reply_to
 
-        try:
-            logger.info(f"Sending batch email to {len(recipients)} recipient(s)...")
-            response = resend.Batch.send(batch_params)
+        batch_params = [{**base_params, "to": [recipient]} for recipient in recipients]
+
+        # Resend caps batch size, so large recipient lists go out as several
+        # batch requests sent concurrently
+        chunks = [batch_params[i:i + _BATCH_LIMIT] for i in range(0, len(batch_params), _BATCH_LIMIT)]
 
-            # Response has 'data' array with email IDs and optional 'errors' array
-            errors = response.get('errors', [])
+        try:
+            logger.info("Sending batch email to %d recipient(s)...", len(recipients))
+            if len(chunks) == 1:
+                responses = [_send_with_retry(resend.Batch.send, chunks[0])]
+            else:
+                responses = list(self._get_send_pool().map(
+                    lambda chunk: _send_with_retry(resend.Batch.send, chunk), chunks
+                ))
+
+            # Each response has 'data' array with email IDs and optional 'errors' array;
+            # error indexes are relative to their chunk
+            errors = []
+            for chunk_number, response in enumerate(responses):
+                offset = chunk_number * _BATCH_LIMIT
+                for error in response.get('errors') or []:
+                    index = error.get('index', -1)
+                    errors.append({**error, 'index': index + offset if index >= 0 else index})
 
             # Log success count
             if not errors:
-                logger.info(f"Successfully sent emails to all {len(recipients)} recipient(s)")
+                logger.info("Successfully sent emails to all %d recipient(s)", len(recipients))
             else:
                 success_count = len(recipients) - len(errors)
-                logger.info(f"Successfully sent emails to {success_count}/{len(recipients)} recipient(s)")
+                logger.info("Successfully sent emails to %d/%d recipient(s)", success_count, len(recipients))
 
             # Log individual failures
             success = len(errors) == 0
@@ -101,12 +349,12 @@ class Emailer:
                 index = error.get('index', -1)
                 message = error.get('message', 'Unknown error')
                 recipient = recipients[index] if 0 <= index < len(recipients) else 'unknown'
-                logger.error(f"Failed to send email to {recipient} (index {index}): {message}")
+                logger.error("Failed to send email to %s (index %s): %s", recipient, index, message)
 
             return success, html_body
 
         except Exception as e:
-            logger.error(f"Failed to send batch emails: {e}")
+            logger.error("Failed to send batch emails: %s", e)
             return False, html_body
 
     def send_error_summary_email(self, failed_episodes: List[dict],
@@ -131,157 +379,135 @@ class Emailer:
         text_body = self._build_error_text(failed_episodes)
 
         try:
-            logger.info(f"Sending error summary to {system_email}...")
+            logger.info("Sending error summary to %s...", system_email)
 
             params = {
-                "from": f"Podcast Summaries <{self.from_email}>",
+                "from": self._from_error,
                 "to": [system_email],
                 "subject": subject,
                 "html": html_body,
                 "text": text_body,
-                **({"reply_to": [self.reply_to_email]} if self.reply_to_email else {})
+                **({"reply_to": self._reply_to} if self._reply_to else {})
             }
 
-            response = resend.Emails.send(params)
-            logger.info(f"Error summary sent: {response}")
+            response = _send_with_retry(resend.Emails.send, params)
+            logger.info("Error summary sent: %s", response)
             return True
 
         except Exception as e:
-            logger.error(f"Failed to send error summary: {e}")
+            logger.error("Failed to send error summary: %s", e)
             return False
 
-    def _format_duration(self, duration_minutes: Optional[int]) -> str:
-        """Format duration in minutes to human-readable string."""
-        if not duration_minutes:
-            return ""
-
-        if duration_minutes < 60:
-            return f"{duration_minutes} min"
-
-        hours = duration_minutes // 60
-        minutes = duration_minutes % 60
-        if minutes == 0:
-            return f"{hours}h"
-        return f"{hours}h {minutes}m"
-
-    def _format_published_date(self, published_date: str) -> str:
-        """Format published date to human-readable string."""
-        from datetime import datetime
-        try:
-            # Parse ISO format date
-            dt = datetime.fromisoformat(published_date.replace('Z', '+00:00'))
-            # Format as "Mon DD, YYYY" (3-letter month)
-            # Check if time component exists (not midnight UTC)
-            if dt.hour != 0 or dt.minute != 0:
-                # Include time if present: "Dec 07, 2025 2:30 PM"
-                return dt.strftime("%b %d, %Y %I:%M %p")
-            else:
-                # Date only: "Dec 07, 2025"
-                return dt.strftime("%b %d, %Y")
-        except (ValueError, AttributeError):
-            # Return original if parsing fails
-            return published_date
-
     def _build_html_body(self, podcast_name: str, episode_title: str, episode_link: str,
                         image_url: Optional[str], summary: str,
                         duration_minutes: Optional[int] = None,
                         published_date: Optional[str] = None,
                         podcast_link: Optional[str] = None) -> str:
-        """Build HTML email body."""
-        html = "<html><body style='font-family: Arial, sans-serif;'>"
+        """Build HTML email body.
+
+        RSS-provided fields (titles, names, URLs) are HTML-escaped; the summary
+        is rendered from markdown.
+        """
+        esc_title = html.escape(episode_title or "")
+        esc_podcast = html.escape(podcast_name or "")
+        esc_episode_link = html.escape(episode_link or "")
 
         # Episode image if available
+        img_block = ""
         if image_url:
-            html += f"<img src='{image_url}' alt='Episode artwork' style='max-width: 250px; margin-bottom: 20px;'><br>"
-
-        # Episode title
-        html += f"<h2 style='margin-bottom: 8px;'>{episode_title}</h2>"
+            img_block = _IMAGE_HTML_TEMPLATE.format(url=html.escape(image_url))
 
-        # Podcast metadata section (small/diminutive)
-        html += "<div style='font-size: 0.85em; color: #666; margin-bottom: 16px;'>"
-
-        # Podcast link
+        # Podcast name, linked when a podcast link is available
+        podcast_block = esc_podcast
         if podcast_link:
-            html += f"<a href='{podcast_link}' style='color: #666; text-decoration: none;'>{podcast_name}</a>"
-        else:
-            html += f"{podcast_name}"
+            podcast_block = _PODCAST_LINK_HTML_TEMPLATE.format(
+                url=html.escape(podcast_link), name=esc_podcast
+            )
 
         # Published date
+        date_block = ""
         if published_date:
-            # Format the date nicely
-            formatted_date = self._format_published_date(published_date)
-            html += f" • {formatted_date}"
-
-        html += "</div>"
+            date_block = f" • {html.escape(_format_published_date(published_date))}"
 
         # Link to episode with duration
-        duration_text = f" ({self._format_duration(duration_minutes)})" if duration_minutes else ""
-        html += f"<p><a href='{episode_link}'>Listen to episode</a>{duration_text}</p>"
+        duration_text = f" ({_format_duration(duration_minutes)})" if duration_minutes else ""
 
-        # Summary
-        html += "<hr>"
         # Convert markdown to HTML (with extras for better list handling)
-        summary_html = markdown2.markdown(summary, extras=["cuddled-lists", "fenced-code-blocks", "tables"])
-        html += f"<div style='margin-top: 20px;'>{summary_html}</div>"
-
-        html += "</body></html>"
-        return html
+        summary_html = _render_markdown(summary)
+
+        return _SUMMARY_HTML_TEMPLATE.format(
+            img_block=img_block,
+            title=esc_title,
+            podcast_block=podcast_block,
+            date_block=date_block,
+            episode_link=esc_episode_link,
+            duration_text=duration_text,
+            summary_html=summary_html
+        )
 
     def _build_text_body(self, podcast_name: str, episode_title: str, episode_link: str,
                         summary: str, duration_minutes: Optional[int] = None,
                         published_date: Optional[str] = None,
                         podcast_link: Optional[str] = None) -> str:
         """Build plain text email body."""
-        text = f"{episode_title}\n\n"
+        parts = [f"{episode_title}\n\n"]
 
         # Podcast metadata
-        text += f"{podcast_name}"
+        parts.append(f"{podcast_name}")
         if published_date:
-            formatted_date = self._format_published_date(published_date)
-            text += f" • {formatted_date}"
-        text += "\n"
+            formatted_date = _format_published_date(published_date)
+            parts.append(f" • {formatted_date}")
+        parts.append("\n")
         if podcast_link:
-            text += f"{podcast_link}\n"
-        text += "\n"
+            parts.append(f"{podcast_link}\n")
+        parts.append("\n")
 
         # Episode link
-        duration_text = f" ({self._format_duration(duration_minutes)})" if duration_minutes else ""
-        text += f"Listen: {episode_link}{duration_text}\n\n"
+        duration_text = f" ({_format_duration(duration_minutes)})" if duration_minutes else ""
+        parts.append(f"Listen: {episode_link}{duration_text}\n\n")
 
-        text += "=" * 60 + "\n\n"
-        text += summary
-        return text
+        parts.append("=" * 60 + "\n\n")
+        parts.append(summary)
+        return "".join(parts)
 
     def _build_error_html(self, failed_episodes: List[dict]) -> str:
         """Build HTML error report."""
-        html = "<html><body style='font-family: Arial, sans-serif;'>"
-        html += f"<h2>Failed Episodes Report</h2>"
-        html += f"<p>{len(failed_episodes)} episodes failed to process:</p>"
-        html += "<table border='1' cellpadding='10' style='border-collapse: collapse;'>"
-        html += "<tr><th>Podcast</th><th>Episode</th><th>Error</th><th>Failed At</th></tr>"
+        parts = [
+            "<html><body style='font-family: Arial, sans-serif;'>",
+            "<h2>Failed Episodes Report</h2>",
+            f"<p>{len(failed_episodes)} episodes failed to process:</p>",
+            "<table border='1' cellpadding='10' style='border-collapse: collapse;'>",
+            "<tr><th>Podcast</th><th>Episode</th><th>Error</th><th>Failed At</th></tr>",
+        ]
 
         for ep in failed_episodes:
-            html += "<tr>"
-            html += f"<td>{ep.get('podcast_slug', 'Unknown')}</td>"
-            html += f"<td>{ep.get('episode_title', 'Unknown')}</td>"
-            html += f"<td>{ep.get('error_message', 'No details')}</td>"
-            html += f"<td>{ep.get('failed_at', 'Unknown')}</td>"
-            html += "</tr>"
-
-        html += "</table>"
-        html += "</body></html>"
-        return html
+            parts.extend([
+                "<tr>",
+                f"<td>{html.escape(str(ep.get('podcast_slug', 'Unknown')))}</td>",
+                f"<td>{html.escape(str(ep.get('episode_title', 'Unknown')))}</td>",
+                f"<td>{html.escape(str(ep.get('error_message', 'No details')))}</td>",
+                f"<td>{html.escape(str(ep.get('failed_at', 'Unknown')))}</td>",
+                "</tr>",
+            ])
+
+        parts.append("</table>")
+        parts.append("</body></html>")
+        return "".join(parts)
 
     def _build_error_text(self, failed_episodes: List[dict]) -> str:
         """Build plain text error report."""
-        text = f"Failed Episodes Report\n"
-        text += f"{len(failed_episodes)} episodes failed to process:\n\n"
+        parts = [
+            "Failed Episodes Report\n",
+            f"{len(failed_episodes)} episodes failed to process:\n\n",
+        ]
 
         for ep in failed_episodes:
-            text += f"Podcast: {ep.get('podcast_slug', 'Unknown')}\n"
-            text += f"Episode: {ep.get('episode_title', 'Unknown')}\n"
-            text += f"Error: {ep.get('error_message', 'No details')}\n"
-            text += f"Failed At: {ep.get('failed_at', 'Unknown')}\n"
-            text += "-" * 60 + "\n"
-
-        return text
+            parts.extend([
+                f"Podcast: {ep.get('podcast_slug', 'Unknown')}\n",
+                f"Episode: {ep.get('episode_title', 'Unknown')}\n",
+                f"Error: {ep.get('error_message', 'No details')}\n",
+                f"Failed At: {ep.get('failed_at', 'Unknown')}\n",
+                "-" * 60 + "\n",
+            ])
+
+        return "".join(parts)
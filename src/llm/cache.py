@@ -0,0 +1,88 @@
+"""Persistent cache for LLM responses."""
+
+import json
+import sqlite3
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """SQLite-backed cache of LLM completions keyed on model, settings and prompt.
+
+    Lets re-runs of a pipeline stage (e.g. after an email failure) reuse a
+    summary that was already paid for instead of calling the API again.
+    """
+
+    def __init__(self, db_path: str = "data/cache/llm_responses.db",
+                 ttl_days: int = 30):
+        """Initialize response cache.
+
+        Args:
+            db_path: Path to the SQLite cache file
+            ttl_days: Entries older than this are treated as missing
+        """
+        self.db_path = db_path
+        self.ttl_days = ttl_days
+        self._lock = threading.Lock()
+
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS llm_responses (
+                cache_key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                response TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        self.conn.commit()
+
+    @staticmethod
+    def make_key(model: str, system_prompt: Optional[str], message: str,
+                 params: Optional[Dict[str, Any]] = None) -> str:
+        """Build the cache key for a request.
+
+        Args:
+            model: Model name
+            system_prompt: System instruction, if any
+            message: Fully constructed prompt
+            params: Generation settings (temperature, reasoning depth, ...),
+                    so changing them doesn't return a stale response
+
+        Returns:
+            blake2b-128 hex digest of model|params|system|message
+        """
+        settings = json.dumps(params or {}, sort_keys=True)
+        return hashlib.blake2b(
+            b"|".join((model.encode(), settings.encode(),
+                       (system_prompt or "").encode(), message.encode())),
+            digest_size=16
+        ).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Get a cached response, or None if missing or expired."""
+        with self._lock:
+            row = self.conn.execute("""
+                SELECT response FROM llm_responses
+                WHERE cache_key = ?
+                    AND created_at >= datetime('now', '-' || ? || ' days')
+            """, (key, self.ttl_days)).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, model: str, response: str):
+        """Store a response, replacing any previous entry for the key."""
+        with self._lock:
+            self.conn.execute("""
+                INSERT OR REPLACE INTO llm_responses (cache_key, model, response, created_at)
+                VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+            """, (key, model, response))
+            self.conn.commit()
+
+    def close(self):
+        """Close the cache database."""
+        self.conn.close()
@@ -2,12 +2,19 @@
 
 import os
 import logging
-from typing import Optional
+from typing import Iterator, Optional, TextIO
 from google import genai
 from google.genai import types
 
+from src.llm.cache import ResponseCache
+from src.llm.rate_limiter import RateLimiter, get_rate_limiter
+
 logger = logging.getLogger(__name__)
 
+# Retries for transient failures (rate limits, overloaded/unavailable backend)
+RETRY_ATTEMPTS = 4
+RETRYABLE_STATUS_CODES = (408, 429, 500, 502, 503, 504)
+
 
 class GeminiProvider:
     """Google Gemini provider for LLM calls."""
@@ -17,7 +24,10 @@ class GeminiProvider:
         model: str,
         temperature: Optional[float] = None,
         thinking_level: Optional[str] = None,
-        thinking_budget: Optional[int] = None
+        thinking_budget: Optional[int] = None,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        cache: Optional[ResponseCache] = None
     ):
         """Initialize Gemini provider.
 
@@ -33,6 +43,11 @@ class GeminiProvider:
             thinking_budget: Token budget for reasoning (Gemini 2.5 models)
                            Integer value specifying max thinking tokens
                            Use -1 for automatic/dynamic thinking mode
+            requests_per_minute: Client-side request limit shared by all
+                               providers for this model (None = unlimited)
+            tokens_per_minute: Client-side input token limit, estimated from
+                             prompt length (None = unlimited)
+            cache: Optional persistent response cache consulted by run()
         """
         self.api_key = os.getenv('GEMINI_API_KEY')
         if not self.api_key:
@@ -42,17 +57,230 @@ class GeminiProvider:
         self.temperature = temperature
         self.thinking_level = thinking_level
         self.thinking_budget = thinking_budget
+        self.rate_limiter = get_rate_limiter(f"gemini:{model}", requests_per_minute, tokens_per_minute)
+        self.cache = cache
+
+        # Initialize Gemini client, retrying rate limits and transient server
+        # errors with exponential backoff and jitter
+        self.client = genai.Client(
+            api_key=self.api_key,
+            http_options=types.HttpOptions(
+                retry_options=types.HttpRetryOptions(
+                    attempts=RETRY_ATTEMPTS,
+                    initial_delay=1.0,
+                    max_delay=30.0,
+                    http_status_codes=list(RETRYABLE_STATUS_CODES)
+                )
+            )
+        )
+
+    def _build_api_params(self, message: str, system_prompt: Optional[str] = None) -> dict:
+        """Build generate_content parameters for a prompt.
+
+        Args:
+            message: Fully constructed prompt to send to Gemini
+            system_prompt: Optional system-level instruction
+
+        Returns:
+            Keyword arguments for models.generate_content
+        """
+        # Build configuration
+        config_params = {}
+        if self.temperature is not None:
+            config_params["temperature"] = self.temperature
+
+        # Add thinking configuration (use whichever is set)
+        if self.thinking_level is not None:
+            # Convert string to ThinkingLevel enum
+            thinking_level_enum = (
+                types.ThinkingLevel.HIGH if self.thinking_level.lower() == "high"
+                else types.ThinkingLevel.LOW
+            )
+            config_params["thinking_config"] = types.ThinkingConfig(
+                thinking_level=thinking_level_enum
+            )
+        elif self.thinking_budget is not None:
+            config_params["thinking_config"] = types.ThinkingConfig(
+                thinking_budget=self.thinking_budget
+            )
+
+        if system_prompt:
+            config_params["system_instruction"] = types.Content(
+                role="system",
+                parts=[types.Part(text=system_prompt)]
+            )
+
+        # Build API call parameters (user message is sent as contents)
+        api_params = {
+            "model": self.model_name,
+            "contents": message
+        }
+
+        # Add config if any parameters are set
+        if config_params:
+            api_params["config"] = types.GenerateContentConfig(**config_params)
+
+        return api_params
+
+    def _log_usage(self, response):
+        """Log token usage metadata from a Gemini response, if available."""
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
+        if hasattr(response, 'usage_metadata'):
+            usage = response.usage_metadata
+            usage_info = {}
 
-        # Initialize Gemini client
-        self.client = genai.Client(api_key=self.api_key)
+            if hasattr(usage, 'prompt_token_count'):
+                usage_info['input_tokens'] = usage.prompt_token_count
+            if hasattr(usage, 'candidates_token_count'):
+                usage_info['output_tokens'] = usage.candidates_token_count
+            if hasattr(usage, 'thoughts_token_count'):
+                usage_info['thinking_tokens'] = usage.thoughts_token_count
 
-    def run(self, message: str, system_prompt: Optional[str] = None) -> str:
+            if usage_info:
+                logger.info("Gemini API usage: %s", usage_info)
+        else:
+            logger.debug("Usage metadata not available in response")
+
+    def _cache_key(self, message: str, system_prompt: Optional[str] = None) -> str:
+        """Build the response cache key for a prompt and the generation settings."""
+        return ResponseCache.make_key(self.model_name, system_prompt, message, {
+            'temperature': self.temperature,
+            'thinking_level': self.thinking_level,
+            'thinking_budget': self.thinking_budget,
+        })
+
+    def run(self, message: str, system_prompt: Optional[str] = None,
+            force: bool = False) -> str:
         """Run a Gemini call.
 
         Args:
             message: Fully constructed prompt to send to Gemini
             system_prompt: Optional system-level instruction that will be
                            prepended to the message before sending
+            force: Skip the response cache lookup and call the API
+
+        Returns:
+            Generated completion text
+
+        Raises:
+            Exception: If API call fails
+        """
+        cache_key = None
+        if self.cache:
+            cache_key = self._cache_key(message, system_prompt)
+            if not force:
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    logger.info("Using cached response (%s)", self.model_name)
+                    return cached
+
+        result = "".join(self.run_stream(message, system_prompt)).strip()
+
+        if cache_key and result:
+            self.cache.set(cache_key, self.model_name, result)
+
+        return result
+
+    def run_to_file(self, message: str, f: TextIO, system_prompt: Optional[str] = None,
+                    force: bool = False) -> bool:
+        """Run a Gemini call, writing the completion to a file as it streams.
+
+        Writes begin with the first chunk instead of after the whole
+        generation. The written text matches what run() returns (surrounding
+        whitespace stripped).
+
+        Args:
+            message: Fully constructed prompt to send to Gemini
+            f: Open text file to write the completion to
+            system_prompt: Optional system-level instruction
+            force: Skip the response cache lookup and call the API
+
+        Returns:
+            True if a non-empty completion was written
+
+        Raises:
+            Exception: If API call fails
+        """
+        cache_key = None
+        if self.cache:
+            cache_key = self._cache_key(message, system_prompt)
+            if not force:
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    logger.info("Using cached response (%s)", self.model_name)
+                    f.write(cached)
+                    return bool(cached)
+
+        # Chunks are kept only when they need to be stored in the cache
+        written = [] if cache_key else None
+        started = False
+        pending = ""
+        for chunk in self.run_stream(message, system_prompt):
+            if not started:
+                chunk = chunk.lstrip()
+                if not chunk:
+                    continue
+                started = True
+            # Hold back trailing whitespace until more text follows it
+            chunk = pending + chunk
+            text = chunk.rstrip()
+            pending = chunk[len(text):]
+            if text:
+                f.write(text)
+                if written is not None:
+                    written.append(text)
+
+        if written:
+            self.cache.set(cache_key, self.model_name, "".join(written))
+
+        return started
+
+    def run_stream(self, message: str, system_prompt: Optional[str] = None) -> Iterator[str]:
+        """Run a streaming Gemini call, yielding text as it is generated.
+
+        Args:
+            message: Fully constructed prompt to send to Gemini
+            system_prompt: Optional system-level instruction
+
+        Yields:
+            Chunks of generated completion text
+
+        Raises:
+            Exception: If API call fails
+        """
+        try:
+            logger.info("Calling Gemini API (%s)...", self.model_name)
+
+            if self.rate_limiter:
+                self.rate_limiter.acquire(RateLimiter.estimate_tokens(message, system_prompt))
+
+            # Generate content; usage metadata arrives with the final chunk
+            last_chunk = None
+            for chunk in self.client.models.generate_content_stream(
+                **self._build_api_params(message, system_prompt)
+            ):
+                last_chunk = chunk
+                if chunk.text:
+                    yield chunk.text
+
+            if last_chunk is not None:
+                self._log_usage(last_chunk)
+
+        except Exception as e:
+            logger.error("Gemini API error: %s", e)
+            raise
+
+    async def arun(self, message: str, system_prompt: Optional[str] = None) -> str:
+        """Run a Gemini call without blocking the event loop.
+
+        Same contract as run(); lets callers summarize several episodes
+        concurrently with asyncio.gather (bounded by a semaphore).
+
+        Args:
+            message: Fully constructed prompt to send to Gemini
+            system_prompt: Optional system-level instruction
 
         Returns:
             Generated completion text
@@ -61,70 +289,18 @@ class GeminiProvider:
             Exception: If API call fails
         """
         try:
-            logger.info(f"Calling Gemini API ({self.model_name})...")
-
-            # User message to send to Gemini
-            contents = message
-
-            # Build configuration
-            config_params = {}
-            if self.temperature is not None:
-                config_params["temperature"] = self.temperature
-
-            # Add thinking configuration (use whichever is set)
-            if self.thinking_level is not None:
-                # Convert string to ThinkingLevel enum
-                thinking_level_enum = (
-                    types.ThinkingLevel.HIGH if self.thinking_level.lower() == "high"
-                    else types.ThinkingLevel.LOW
-                )
-                config_params["thinking_config"] = types.ThinkingConfig(
-                    thinking_level=thinking_level_enum
-                )
-            elif self.thinking_budget is not None:
-                config_params["thinking_config"] = types.ThinkingConfig(
-                    thinking_budget=self.thinking_budget
-                )
+            logger.info("Calling Gemini API async (%s)...", self.model_name)
 
-            if system_prompt:
-                config_params["system_instruction"] = types.Content(
-                    role="system",
-                    parts=[types.Part(text=system_prompt)]
-                )
+            if self.rate_limiter:
+                await self.rate_limiter.acquire_async(RateLimiter.estimate_tokens(message, system_prompt))
+
+            response = await self.client.aio.models.generate_content(
+                **self._build_api_params(message, system_prompt)
+            )
+            self._log_usage(response)
 
-            # Build API call parameters
-            api_params = {
-                "model": self.model_name,
-                "contents": contents
-            }
-
-            # Add config if any parameters are set
-            if config_params:
-                api_params["config"] = types.GenerateContentConfig(**config_params)
-
-            # Generate content
-            response = self.client.models.generate_content(**api_params)
-
-            # Extract and log usage metadata if available
-            if hasattr(response, 'usage_metadata'):
-                usage = response.usage_metadata
-                usage_info = {}
-                
-                if hasattr(usage, 'prompt_token_count'):
-                    usage_info['input_tokens'] = usage.prompt_token_count
-                if hasattr(usage, 'candidates_token_count'):
-                    usage_info['output_tokens'] = usage.candidates_token_count
-                if hasattr(usage, 'thoughts_token_count'):
-                    usage_info['thinking_tokens'] = usage.thoughts_token_count
-                
-                if usage_info:
-                    logger.info(f"Gemini API usage: {usage_info}")
-            else:
-                logger.debug("Usage metadata not available in response")
-
-            summary = response.text.strip()
-            return summary
+            return response.text.strip()
 
         except Exception as e:
-            logger.error(f"Gemini API error: {e}")
+            logger.error("Gemini API error: %s", e)
             raise
@@ -2,11 +2,21 @@
 
 import os
 import logging
-from typing import Optional
-from openai import OpenAI
+from typing import Iterator, Optional
+from openai import OpenAI, AsyncOpenAI, RateLimitError
+
+from src.llm.cache import ResponseCache
+from src.llm.rate_limiter import RateLimiter, get_rate_limiter
 
 logger = logging.getLogger(__name__)
 
+# Retries for transient failures (rate limits, connection errors, 5xx)
+MAX_RETRIES = 3
+
+# Flex requests wait for spare capacity and can run far longer than the
+# default tier, so they get a 15 minute client timeout instead of 10
+FLEX_TIMEOUT_SECONDS = 900.0
+
 
 class OpenAIProvider:
     """OpenAI GPT provider for LLM calls."""
@@ -15,7 +25,11 @@ class OpenAIProvider:
         self,
         model: str,
         temperature: Optional[float] = None,
-        reasoning_effort: Optional[str] = None
+        reasoning_effort: Optional[str] = None,
+        service_tier: Optional[str] = None,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        cache: Optional[ResponseCache] = None
     ):
         """Initialize OpenAI provider.
 
@@ -28,6 +42,15 @@ class OpenAIProvider:
             reasoning_effort: Reasoning effort level for o-series models
                             Options: "low", "medium", "high"
                             Only applicable to reasoning models (o1, o3, etc.)
+            service_tier: Processing tier, e.g. "flex" for batch-level pricing
+                        on slower, best-effort capacity (None = default tier).
+                        Flex requests that still hit capacity limits after
+                        retries are resent on the default tier.
+            requests_per_minute: Client-side request limit shared by all
+                               providers for this model (None = unlimited)
+            tokens_per_minute: Client-side input token limit, estimated from
+                             prompt length (None = unlimited)
+            cache: Optional persistent response cache consulted by run()
         """
         self.api_key = os.getenv('OPENAI_API_KEY')
         if not self.api_key:
@@ -36,71 +59,226 @@ class OpenAIProvider:
         self.model = model
         self.temperature = temperature
         self.reasoning_effort = reasoning_effort
-        self.client = OpenAI(api_key=self.api_key)
+        self.service_tier = service_tier
+        self.rate_limiter = get_rate_limiter(f"openai:{model}", requests_per_minute, tokens_per_minute)
+        self.cache = cache
+        # The SDK retries connection errors, 429s and 5xx responses with
+        # exponential backoff and jitter, honoring Retry-After headers
+        client_options = {'api_key': self.api_key, 'max_retries': MAX_RETRIES}
+        if service_tier == "flex":
+            client_options['timeout'] = FLEX_TIMEOUT_SECONDS
+        self.client = OpenAI(**client_options)
+        self._client_options = client_options
+        self._aclient = None
+
+    @property
+    def aclient(self) -> AsyncOpenAI:
+        """Async client, created on first use since most callers only use run()."""
+        if self._aclient is None:
+            self._aclient = AsyncOpenAI(**self._client_options)
+        return self._aclient
+
+    def _build_api_params(self, message: str, system_prompt: Optional[str] = None) -> dict:
+        """Build Responses API parameters for a prompt.
+
+        Args:
+            message: Fully constructed prompt that includes transcript/user input
+            system_prompt: Optional system instruction
+
+        Returns:
+            Keyword arguments for responses.create
+        """
+        # Construct the input prompt - include system prompt only if provided
+        if system_prompt:
+            full_input = f"{system_prompt}\n\n{message}"
+        else:
+            full_input = message
+
+        # Build API call parameters for Responses API
+        api_params = {
+            "model": self.model,
+            "input": full_input
+        }
+
+        # Add temperature if specified (for standard models)
+        if self.temperature is not None:
+            api_params["temperature"] = self.temperature
+
+        # Add reasoning effort if specified (for reasoning models)
+        if self.reasoning_effort is not None:
+            api_params["reasoning"] = {"effort": self.reasoning_effort}
+        else:
+            # For non-reasoning models, max_tokens is required/recommended
+            # Default to 1000 if not specified
+            api_params["max_tokens"] = 1000
+
+        if self.service_tier is not None:
+            api_params["service_tier"] = self.service_tier
+
+        return api_params
+
+    def _default_tier_params(self, api_params: dict, error: Exception) -> Optional[dict]:
+        """Get parameters to resend a flex request on the default tier.
+
+        Args:
+            api_params: Parameters of the request that failed
+            error: Error the request failed with
+
+        Returns:
+            Parameters without the flex tier, or None if the error isn't a
+            flex capacity error and should be raised
+        """
+        if api_params.get("service_tier") != "flex" or not isinstance(error, RateLimitError):
+            return None
+
+        logger.warning("Flex capacity unavailable for %s (%s), retrying on the default tier",
+                       self.model, error)
+        return {k: v for k, v in api_params.items() if k != "service_tier"}
+
+    def _create_response(self, api_params: dict, **kwargs):
+        """Call responses.create, falling back to the default tier if flex is full."""
+        try:
+            return self.client.responses.create(**api_params, **kwargs)
+        except Exception as e:
+            fallback_params = self._default_tier_params(api_params, e)
+            if fallback_params is None:
+                raise
+            return self.client.responses.create(**fallback_params, **kwargs)
+
+    async def _acreate_response(self, api_params: dict):
+        """Async counterpart of _create_response()."""
+        try:
+            return await self.aclient.responses.create(**api_params)
+        except Exception as e:
+            fallback_params = self._default_tier_params(api_params, e)
+            if fallback_params is None:
+                raise
+            return await self.aclient.responses.create(**fallback_params)
+
+    def _log_usage(self, response):
+        """Log token usage metadata from an OpenAI response, if available."""
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
+        if hasattr(response, 'usage'):
+            usage = response.usage
+            usage_info = {
+                'input_tokens': usage.input_tokens,
+                'output_tokens': usage.output_tokens,
+            }
+
+            # Add output token details if available
+            if hasattr(usage, 'output_tokens_details') and usage.output_tokens_details:
+                if hasattr(usage.output_tokens_details, 'reasoning_tokens'):
+                    usage_info['reasoning_tokens'] = usage.output_tokens_details.reasoning_tokens
+
+            logger.info("OpenAI API usage: %s", usage_info)
+        else:
+            logger.debug("Usage metadata not available in response")
 
-    def run(self, message: str, system_prompt: Optional[str] = None) -> str:
+    def _cache_key(self, message: str, system_prompt: Optional[str] = None) -> str:
+        """Build the response cache key for a prompt and the generation settings."""
+        return ResponseCache.make_key(self.model, system_prompt, message, {
+            'temperature': self.temperature,
+            'reasoning_effort': self.reasoning_effort,
+            'service_tier': self.service_tier,
+        })
+
+    def run(self, message: str, system_prompt: Optional[str] = None,
+            force: bool = False) -> str:
         """Generate a completion for a fully constructed prompt.
 
         Args:
             message: Fully constructed prompt that includes transcript/user input
             system_prompt: Optional system instruction. If not provided, no system prompt is used.
+            force: Skip the response cache lookup and call the API
 
         Returns:
             Generated completion text
 
+        Raises:
+            Exception: If API call fails
+        """
+        cache_key = None
+        if self.cache:
+            cache_key = self._cache_key(message, system_prompt)
+            if not force:
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    logger.info("Using cached response (%s)", self.model)
+                    return cached
+
+        result = "".join(self.run_stream(message, system_prompt)).strip()
+
+        if cache_key and result:
+            self.cache.set(cache_key, self.model, result)
+
+        return result
+
+    def run_stream(self, message: str, system_prompt: Optional[str] = None) -> Iterator[str]:
+        """Generate a streaming completion, yielding text as it is generated.
+
+        Args:
+            message: Fully constructed prompt that includes transcript/user input
+            system_prompt: Optional system instruction
+
+        Yields:
+            Chunks of generated completion text
+
         Raises:
             Exception: If API call fails
         """
         try:
-            logger.info(f"Calling OpenAI API ({self.model})...")
-
-            # Construct the input prompt - include system prompt only if provided
-            if system_prompt:
-                full_input = f"{system_prompt}\n\n{message}"
-            else:
-                full_input = message
-
-            # Build API call parameters for Responses API
-            api_params = {
-                "model": self.model,
-                "input": full_input
-            }
+            logger.info("Calling OpenAI API (%s)...", self.model)
+
+            if self.rate_limiter:
+                self.rate_limiter.acquire(RateLimiter.estimate_tokens(message, system_prompt))
+
+            # Call OpenAI Responses API; usage arrives with the completed event
+            stream = self._create_response(
+                self._build_api_params(message, system_prompt), stream=True
+            )
+            for event in stream:
+                if event.type == "response.output_text.delta":
+                    yield event.delta
+                elif event.type == "response.completed":
+                    self._log_usage(event.response)
+                elif event.type == "response.failed":
+                    raise Exception(f"Response failed: {event.response.error}")
+                elif event.type == "error":
+                    raise Exception(event.message)
+
+        except Exception as e:
+            logger.error("OpenAI API error: %s", e)
+            raise
+
+    async def arun(self, message: str, system_prompt: Optional[str] = None) -> str:
+        """Generate a completion without blocking the event loop.
+
+        Same contract as run(); lets callers issue several requests
+        concurrently with asyncio.gather (bounded by a semaphore).
+
+        Args:
+            message: Fully constructed prompt that includes transcript/user input
+            system_prompt: Optional system instruction
+
+        Returns:
+            Generated completion text
+
+        Raises:
+            Exception: If API call fails
+        """
+        try:
+            logger.info("Calling OpenAI API async (%s)...", self.model)
+
+            if self.rate_limiter:
+                await self.rate_limiter.acquire_async(RateLimiter.estimate_tokens(message, system_prompt))
+
+            response = await self._acreate_response(self._build_api_params(message, system_prompt))
+            self._log_usage(response)
 
-            # Add temperature if specified (for standard models)
-            if self.temperature is not None:
-                api_params["temperature"] = self.temperature
-
-            # Add reasoning effort if specified (for reasoning models)
-            if self.reasoning_effort is not None:
-                api_params["reasoning"] = {"effort": self.reasoning_effort}
-            else:
-                # For non-reasoning models, max_tokens is required/recommended
-                # Default to 1000 if not specified
-                api_params["max_tokens"] = 1000
-
-            # Call OpenAI Responses API
-            response = self.client.responses.create(**api_params)
-
-            # Extract and log usage metadata if available
-            if hasattr(response, 'usage'):
-                usage = response.usage
-                usage_info = {
-                    'input_tokens': usage.input_tokens,
-                    'output_tokens': usage.output_tokens,
-                }
-                
-                # Add output token details if available
-                if hasattr(usage, 'output_tokens_details') and usage.output_tokens_details:
-                    if hasattr(usage.output_tokens_details, 'reasoning_tokens'):
-                        usage_info['reasoning_tokens'] = usage.output_tokens_details.reasoning_tokens
-                
-                logger.info(f"OpenAI API usage: {usage_info}")
-            else:
-                logger.debug("Usage metadata not available in response")
-
-            summary = response.output_text.strip()
-            return summary
+            return response.output_text.strip()
 
         except Exception as e:
-            logger.error(f"OpenAI API error: {e}")
+            logger.error("OpenAI API error: %s", e)
             raise
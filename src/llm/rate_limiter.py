@@ -0,0 +1,124 @@
+"""Client-side rate limiting for LLM API calls."""
+
+import time
+import asyncio
+import logging
+import threading
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at a per-minute rate."""
+
+    def __init__(self, rate_per_minute: int):
+        """Initialize token bucket.
+
+        Args:
+            rate_per_minute: Units replenished per minute (also the burst capacity)
+        """
+        if rate_per_minute <= 0:
+            raise ValueError("rate_per_minute must be a positive integer")
+
+        self.capacity = float(rate_per_minute)
+        self.rate_per_second = rate_per_minute / 60.0
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float = 1) -> float:
+        """Reserve units from the bucket.
+
+        The reservation is taken immediately (the bucket may go negative), so
+        concurrent callers queue up fairly behind each other.
+
+        Args:
+            amount: Units to reserve (clamped to the bucket capacity)
+
+        Returns:
+            Seconds the caller must wait before proceeding
+        """
+        amount = min(float(amount), self.capacity)
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self.last_refill
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate_per_second)
+            self.last_refill = now
+
+            self.tokens -= amount
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate_per_second
+
+
+class RateLimiter:
+    """Requests-per-minute and tokens-per-minute limiter for an LLM provider."""
+
+    def __init__(self, requests_per_minute: Optional[int] = None,
+                 tokens_per_minute: Optional[int] = None):
+        """Initialize rate limiter.
+
+        Args:
+            requests_per_minute: Max requests per minute (None = unlimited)
+            tokens_per_minute: Max estimated input tokens per minute (None = unlimited)
+        """
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+
+    @staticmethod
+    def estimate_tokens(*texts: Optional[str]) -> int:
+        """Roughly estimate token count (~4 characters per token)."""
+        return max(1, sum(len(text) for text in texts if text) // 4)
+
+    def _reserve(self, estimated_tokens: int) -> float:
+        """Reserve capacity in both buckets and return the required wait."""
+        wait = 0.0
+        if self.requests:
+            wait = max(wait, self.requests.reserve(1))
+        if self.tokens:
+            wait = max(wait, self.tokens.reserve(estimated_tokens))
+        if wait > 0:
+            logger.info("Rate limit reached, waiting %.1fs before next LLM call", wait)
+        return wait
+
+    def acquire(self, estimated_tokens: int = 1):
+        """Block until a request of the given size may be sent."""
+        wait = self._reserve(estimated_tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, estimated_tokens: int = 1):
+        """Wait (without blocking the event loop) until a request may be sent."""
+        wait = self._reserve(estimated_tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+_shared_limiters: Dict[Tuple[str, Optional[int], Optional[int]], RateLimiter] = {}
+_shared_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(key: str, requests_per_minute: Optional[int] = None,
+                     tokens_per_minute: Optional[int] = None) -> Optional[RateLimiter]:
+    """Get a process-wide limiter shared by all providers with the same key.
+
+    Providers are created per call, so limits must live outside the provider
+    instance to pace consecutive calls.
+
+    Args:
+        key: Limiter identity (e.g. "gemini:gemini-2.5-flash")
+        requests_per_minute: Max requests per minute (None = unlimited)
+        tokens_per_minute: Max estimated input tokens per minute (None = unlimited)
+
+    Returns:
+        Shared RateLimiter, or None if no limits are configured
+    """
+    if not requests_per_minute and not tokens_per_minute:
+        return None
+
+    limiter_key = (key, requests_per_minute, tokens_per_minute)
+    with _shared_limiters_lock:
+        if limiter_key not in _shared_limiters:
+            _shared_limiters[limiter_key] = RateLimiter(requests_per_minute, tokens_per_minute)
+        return _shared_limiters[limiter_key]
@@ -1,45 +1,118 @@
 """RSS feed parser for podcast episodes."""
 
+import io
+import re
+import json
 import feedparser
 import logging
-import xml.etree.ElementTree as ET
-from datetime import datetime
-from typing import List, Dict, Any, Optional
-from time import mktime
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import List, Dict, Any, Optional, Union
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+# Feed HTTP settings: retry rate limits and transient server errors with
+# exponential backoff (honoring Retry-After)
+FETCH_TIMEOUT_SECONDS = 30
+FETCH_RETRIES = 3
+RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+FETCH_CHUNK_SIZE = 64 * 1024
+
+# Podcast-level field lookups, in priority order
+_DESCRIPTION_KEYS = ('itunes_summary', 'description', 'summary', 'itunes_subtitle')
+_AUTHOR_KEYS = ('itunes_author', 'author')
+
+# MIME type prefixes for audio enclosures and artwork
+_AUDIO_MIMES = ('audio/',)
+_IMAGE_MIMES = ('image/',)
+
+# ISO-like formats tried for date strings that aren't RFC 822
+_DATE_FORMATS = ('%Y-%m-%dT%H:%M:%S%z', '%Y-%m-%d %H:%M:%S', '%Y-%m-%d')
+
+# Raw <item>/<entry> elements, in document order (same order as feed.entries)
+_RAW_ITEM_RE = re.compile(rb'<item[\s>].*?</item>|<entry[\s>].*?</entry>', re.DOTALL)
+
+# HH:MM:SS or MM:SS itunes:duration values
+_DURATION_RE = re.compile(r'^(?:(\d+):)?(\d+):(\d+)$')
+
 
 class RSSParser:
     """Parse podcast RSS feeds."""
 
-    def __init__(self, max_audio_length_minutes: int = 240):
+    def __init__(self, max_audio_length_minutes: int = 240,
+                 fetch_chunk_size: int = FETCH_CHUNK_SIZE,
+                 session: Optional[requests.Session] = None):
         """Initialize RSS parser.
 
         Args:
             max_audio_length_minutes: Skip episodes longer than this
+            fetch_chunk_size: Bytes read per chunk when streaming feeds
+            session: HTTP session to fetch feeds with (default: a new session
+                     with feedparser's headers and retries)
         """
         self.max_audio_length_minutes = max_audio_length_minutes
-
-    def fetch_episodes(self, rss_url: str, check_last_n: int = 3) -> tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        self.fetch_chunk_size = fetch_chunk_size
+
+        # Cache validators ({'etag', 'last_modified'}) from the latest 200
+        # response per feed URL, for callers to persist once processed
+        self.feed_validators: Dict[str, Dict[str, Optional[str]]] = {}
+
+        # Feed URLs whose latest fetch came back 304 Not Modified
+        self.not_modified: set[str] = set()
+
+        # Shared HTTP session: keep-alive connections and retries for feed fetches
+        self.session = session if session is not None else self._build_session()
+
+    @staticmethod
+    def _build_session() -> requests.Session:
+        """Create the default feed-fetching session."""
+        session = requests.Session()
+        session.headers.update({
+            'User-Agent': feedparser.USER_AGENT,
+            'Accept': feedparser.http.ACCEPT_HEADER,
+        })
+        retry = Retry(
+            total=FETCH_RETRIES,
+            backoff_factor=1.0,
+            status_forcelist=RETRYABLE_STATUS_CODES,
+            allowed_methods=frozenset(['GET']),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(max_retries=retry)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def fetch_episodes(self, rss_url: str, check_last_n: int = 3,
+                       etag: Optional[str] = None,
+                       last_modified: Optional[str] = None) -> tuple[List[Dict[str, Any]], Dict[str, Any]]:
         """Fetch and parse episodes from RSS feed.
 
         Args:
             rss_url: RSS feed URL
             check_last_n: Number of recent episodes to return
+            etag: ETag from a previous fetch (sent as If-None-Match)
+            last_modified: Last-Modified from a previous fetch (sent as If-Modified-Since)
 
         Returns:
-            Tuple of (episodes list, podcast metadata dict)
+            Tuple of (episodes list, podcast metadata dict); both empty if
+            the feed has not changed since the given validators
 
         Raises:
             Exception: If there's an error fetching or parsing the feed
         """
         logger.info(f"Fetching RSS feed: {rss_url}")
-        feed = feedparser.parse(rss_url)
+        fetched = self._fetch_feed(rss_url, max_items=check_last_n,
+                                   etag=etag, last_modified=last_modified)
 
-        # Check for HTTP errors
-        if hasattr(feed, 'status') and feed.status >= 400:
-            raise Exception(f"HTTP error {feed.status} fetching RSS feed")
+        if fetched is None:
+            logger.info(f"RSS feed not modified since last fetch: {rss_url}")
+            return [], {}
+        feed, content = fetched
 
         if feed.bozo and feed.bozo_exception:
             # Only raise for serious parsing errors, not minor issues
@@ -53,24 +126,229 @@ class RSSParser:
         # Extract podcast-level metadata
         podcast_metadata = self._extract_podcast_metadata(feed)
 
+        raw_items = self._split_raw_items(content, feed)
+
         episodes = []
-        for entry in feed.entries[:check_last_n]:
-            episode = self._parse_entry(entry, rss_url)
+        for index, entry in enumerate(feed.entries[:check_last_n]):
+            raw_rss = raw_items[index] if raw_items else None
+            episode = self._parse_entry(entry, rss_url, raw_rss)
             if episode:
-                # Check duration limit
-                duration_minutes = episode.get('duration_minutes')
-                if duration_minutes and duration_minutes > self.max_audio_length_minutes:
-                    logger.warning(
-                        f"Skipping episode '{episode['title']}': "
-                        f"duration {duration_minutes} min exceeds limit {self.max_audio_length_minutes} min"
-                    )
-                    continue
-
                 episodes.append(episode)
 
         logger.info(f"Parsed {len(episodes)} episodes from {rss_url}")
         return episodes, podcast_metadata
 
+    def fetch_episodes_many(self, rss_urls: List[str], check_last_n: int = 3,
+                            max_workers: int = 8,
+                            validators: Optional[Dict[str, Dict[str, Optional[str]]]] = None
+                            ) -> Dict[str, Union[tuple, Exception]]:
+        """Fetch and parse several RSS feeds concurrently.
+
+        Feed fetching is I/O bound, so feeds are downloaded in parallel
+        threads and total time approaches the slowest feed rather than the
+        sum of all of them.
+
+        Args:
+            rss_urls: RSS feed URLs
+            check_last_n: Number of recent episodes to return per feed
+            max_workers: Maximum number of concurrent fetches
+            validators: Optional cache validators per URL
+                        ({'etag': ..., 'last_modified': ...})
+
+        Returns:
+            Dict mapping each URL to its (episodes, podcast metadata) tuple,
+            or to the exception raised while fetching/parsing that feed
+        """
+        unique_urls = list(dict.fromkeys(rss_urls))
+        if not unique_urls:
+            return {}
+        validators = validators or {}
+
+        def fetch(rss_url):
+            cached = validators.get(rss_url) or {}
+            try:
+                return self.fetch_episodes(rss_url, check_last_n=check_last_n,
+                                           etag=cached.get('etag'),
+                                           last_modified=cached.get('last_modified'))
+            except Exception as e:
+                # Returned rather than raised so one bad feed doesn't hide the others
+                return e
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_urls)),
+                                thread_name_prefix="rss-fetch") as pool:
+            results = pool.map(fetch, unique_urls)
+            return dict(zip(unique_urls, results))
+
+    def _fetch_feed(self, rss_url: str, max_items: Optional[int] = None,
+                    etag: Optional[str] = None, last_modified: Optional[str] = None):
+        """Download an RSS feed and parse it with feedparser.
+
+        Args:
+            rss_url: RSS feed URL
+            max_items: Only parse this many leading items (None = all)
+            etag: ETag validator for a conditional request
+            last_modified: Last-Modified validator for a conditional request
+
+        Returns:
+            Tuple of (feedparser result, document bytes that were parsed),
+            or None if the server reports 304 Not Modified
+
+        Raises:
+            Exception: On network errors or HTTP error status
+        """
+        request_headers = {}
+        if etag:
+            request_headers['If-None-Match'] = etag
+        if last_modified:
+            request_headers['If-Modified-Since'] = last_modified
+
+        try:
+            with self.session.get(rss_url, headers=request_headers,
+                                  timeout=FETCH_TIMEOUT_SECONDS, stream=True) as response:
+                if response.status_code == 304:
+                    self.not_modified.add(rss_url)
+                    return None
+                self.not_modified.discard(rss_url)
+
+                # Check for HTTP errors
+                if response.status_code >= 400:
+                    raise Exception(f"HTTP error {response.status_code} fetching RSS feed")
+
+                self.feed_validators[rss_url] = {
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified'),
+                }
+
+                # Pass response headers so feedparser can detect encoding and base URI
+                response_headers = {k.lower(): v for k, v in response.headers.items()}
+                response_headers.setdefault('content-location', response.url)
+
+                content = self._read_feed(response, max_items)
+        except requests.RequestException as e:
+            raise Exception(f"Network error fetching RSS feed: {e}")
+
+        if max_items:
+            content = self._trim_feed(content, max_items)
+
+        # Wrap the bytes in a file object: given bytes, feedparser first tries
+        # them as a local path, which would let a server point it at local files
+        return feedparser.parse(io.BytesIO(content), response_headers=response_headers), content
+
+    @staticmethod
+    def _split_raw_items(content: bytes, feed) -> Optional[List[str]]:
+        """Slice the raw XML of each item/entry out of a feed document.
+
+        Args:
+            content: Feed document that feedparser parsed
+            feed: feedparser result for the document
+
+        Returns:
+            Raw XML strings aligned with feed.entries, or None if the items
+            can't be matched up with the parsed entries
+        """
+        raw_items = _RAW_ITEM_RE.findall(content)
+        if len(raw_items) != len(feed.entries):
+            return None
+
+        encoding = feed.get('encoding') or 'utf-8'
+        try:
+            return [item.decode(encoding, errors='replace') for item in raw_items]
+        except LookupError:
+            return [item.decode('utf-8', errors='replace') for item in raw_items]
+
+    def _read_feed(self, response, max_items: Optional[int] = None) -> bytes:
+        """Read a streamed feed body in fixed-size chunks.
+
+        When max_items is set, reading stops as soon as one item past the
+        requested count has arrived, since the rest would be trimmed anyway.
+
+        Args:
+            response: Streaming requests response
+            max_items: Number of leading items/entries needed (None = all)
+
+        Returns:
+            Feed document bytes (possibly cut short)
+        """
+        buffer = bytearray()
+        close_tag = None
+        items_seen = 0
+        scan_pos = 0
+
+        for chunk in response.iter_content(chunk_size=self.fetch_chunk_size):
+            buffer += chunk
+            if not max_items:
+                continue
+
+            if close_tag is None:
+                tags = self._feed_close_tags(buffer)
+                if tags is None:
+                    if len(buffer) >= 4096:
+                        max_items = None  # Unknown format, read it all
+                    continue
+                close_tag = tags[0]
+
+            # Count item close tags in the newly received data
+            while True:
+                index = buffer.find(close_tag, scan_pos)
+                if index == -1:
+                    break
+                items_seen += 1
+                scan_pos = index + len(close_tag)
+            scan_pos = max(scan_pos, len(buffer) - len(close_tag) + 1)
+
+            if items_seen > max_items:
+                break
+
+        return bytes(buffer)
+
+    @staticmethod
+    def _feed_close_tags(content) -> Optional[tuple[bytes, bytes]]:
+        """Detect the item close tag and document suffix for a feed.
+
+        Returns:
+            Tuple of (item close tag, closing suffix), or None if unknown
+        """
+        head = content[:4096]
+        if b'<rss' in head:
+            return b'</item>', b'</channel></rss>'
+        if b'<feed' in head:
+            return b'</entry>', b'</feed>'
+        return None
+
+    @staticmethod
+    def _trim_feed(content: bytes, max_items: int) -> bytes:
+        """Cut a feed document off after its first max_items items.
+
+        Podcast feeds often carry hundreds of episodes but only the newest
+        few are used, so everything after them is dropped and the document
+        closed before feedparser builds entries for it. Channel-level tags
+        are expected before the items (as podcast feeds place them).
+
+        Args:
+            content: Raw feed document
+            max_items: Number of leading items/entries to keep
+
+        Returns:
+            Trimmed document, or the original if it can't be trimmed safely
+        """
+        tags = RSSParser._feed_close_tags(content)
+        if tags is None:
+            return content
+        close_tag, suffix = tags
+
+        end = -1
+        for _ in range(max_items):
+            end = content.find(close_tag, end + 1)
+            if end == -1:
+                return content
+        end += len(close_tag)
+
+        # Nothing left to skip but the closing tags
+        if content.find(close_tag, end) == -1:
+            return content
+
+        return content[:end] + suffix
+
     def _extract_podcast_metadata(self, feed) -> Dict[str, Any]:
         """Extract podcast-level metadata from feed.
 
@@ -82,88 +360,85 @@ class RSSParser:
         """
         metadata = {}
 
-        if not hasattr(feed, 'feed'):
+        feed_info = feed.get('feed')
+        if not feed_info:
             return metadata
 
         # Extract podcast title
-        if hasattr(feed.feed, 'title') and feed.feed.title:
-            metadata['title'] = feed.feed.title
+        if feed_info.get('title'):
+            metadata['title'] = feed_info['title']
 
         # Extract podcast description (prioritize podcast-standard fields)
-        description = None
-        if hasattr(feed.feed, 'itunes_summary') and feed.feed.itunes_summary:
-            description = feed.feed.itunes_summary
-        elif hasattr(feed.feed, 'description') and feed.feed.description:
-            description = feed.feed.description
-        elif hasattr(feed.feed, 'summary') and feed.feed.summary:
-            description = feed.feed.summary
-        elif hasattr(feed.feed, 'itunes_subtitle') and feed.feed.itunes_subtitle:
-            description = feed.feed.itunes_subtitle
-
+        description = self._first_value(feed_info, _DESCRIPTION_KEYS)
         if description:
             metadata['description'] = description
 
         # Extract podcast author (prioritize iTunes field for podcast feeds)
-        author = None
-        if hasattr(feed.feed, 'itunes_author') and feed.feed.itunes_author:
-            author = feed.feed.itunes_author
-        elif hasattr(feed.feed, 'author') and feed.feed.author:
-            author = feed.feed.author
-        elif hasattr(feed.feed, 'author_detail') and hasattr(feed.feed.author_detail, 'name') and feed.feed.author_detail.name:
-            author = feed.feed.author_detail.name
-
+        author = (self._first_value(feed_info, _AUTHOR_KEYS)
+                  or (feed_info.get('author_detail') or {}).get('name'))
         if author:
             metadata['author'] = author
 
         # Extract podcast link
-        if hasattr(feed.feed, 'link') and feed.feed.link:
-            metadata['link'] = feed.feed.link
+        if feed_info.get('link'):
+            metadata['link'] = feed_info['link']
 
         # Extract podcast image URL (for email fallback when episode image is missing)
         image_url = None
-        if hasattr(feed.feed, 'itunes_image') and feed.feed.itunes_image:
+        itunes_image = feed_info.get('itunes_image')
+        image = feed_info.get('image')
+        if itunes_image:
             # iTunes image can be a dict with 'href' or a string
-            if isinstance(feed.feed.itunes_image, dict):
-                image_url = feed.feed.itunes_image.get('href')
-            elif isinstance(feed.feed.itunes_image, str):
-                image_url = feed.feed.itunes_image
-        elif hasattr(feed.feed, 'image') and feed.feed.image:
+            if isinstance(itunes_image, dict):
+                image_url = itunes_image.get('href')
+            elif isinstance(itunes_image, str):
+                image_url = itunes_image
+        elif image:
             # Standard RSS image element (has url sub-element)
-            if isinstance(feed.feed.image, dict):
-                image_url = feed.feed.image.get('href') or feed.feed.image.get('url')
-            elif isinstance(feed.feed.image, str):
-                image_url = feed.feed.image
+            if isinstance(image, dict):
+                image_url = image.get('href') or image.get('url')
+            elif isinstance(image, str):
+                image_url = image
 
         if image_url:
             metadata['image_url'] = image_url
 
         # Extract podcast categories
         categories = []
-        if hasattr(feed.feed, 'tags') and feed.feed.tags:
-            # feedparser normalizes categories to 'tags' list
-            for tag in feed.feed.tags:
-                if isinstance(tag, dict):
-                    # tag has 'term' (category name) and optional 'scheme' (category type)
-                    term = tag.get('term')
-                    if term and term not in categories:
-                        categories.append(term)
-                elif isinstance(tag, str) and tag not in categories:
-                    categories.append(tag)
+        # feedparser normalizes categories to 'tags' list
+        for tag in feed_info.get('tags') or []:
+            if isinstance(tag, dict):
+                # tag has 'term' (category name) and optional 'scheme' (category type)
+                term = tag.get('term')
+                if term and term not in categories:
+                    categories.append(term)
+            elif isinstance(tag, str) and tag not in categories:
+                categories.append(tag)
 
         if categories:
             metadata['categories'] = categories
 
         return metadata
 
-    def _parse_entry(self, entry, rss_url: str) -> Optional[Dict[str, Any]]:
+    @staticmethod
+    def _first_value(data, keys: tuple) -> Any:
+        """Return the first truthy value among keys of a feedparser dict."""
+        for key in keys:
+            value = data.get(key)
+            if value:
+                return value
+        return None
+
+    def _parse_entry(self, entry, rss_url: str, raw_rss: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """Parse individual feed entry.
 
         Args:
             entry: feedparser entry object
             rss_url: RSS feed URL (for logging)
+            raw_rss: Raw XML of the entry, if available
 
         Returns:
-            Episode dictionary or None if invalid
+            Episode dictionary or None if invalid or over the duration limit
         """
         try:
             # Extract GUID (required for deduplication)
@@ -172,6 +447,15 @@ class RSSParser:
                 logger.error(f"Entry missing GUID, skipping: {entry.get('title', 'Unknown')}")
                 return None
 
+            # Check duration limit before doing any other extraction
+            duration_minutes = self._parse_duration(entry)
+            if duration_minutes and duration_minutes > self.max_audio_length_minutes:
+                logger.warning(
+                    f"Skipping episode '{entry.get('title', '')}': "
+                    f"duration {duration_minutes} min exceeds limit {self.max_audio_length_minutes} min"
+                )
+                return None
+
             # Extract audio URL and file size from enclosures
             audio_url, file_size_bytes = self._extract_audio_url(entry)
             if not audio_url:
@@ -189,19 +473,16 @@ class RSSParser:
             # Parse published date with fallbacks
             published_date = self._parse_published_date(entry)
 
-            # Parse duration
-            duration_minutes = self._parse_duration(entry)
-
-            # Get raw RSS for this entry (convert to JSON-serializable format)
-            import json
-            # Convert feedparser entry to dict, removing non-serializable objects
-            entry_dict = dict(entry)
-            # Remove time.struct_time objects that aren't JSON serializable
-            if 'published_parsed' in entry_dict:
-                del entry_dict['published_parsed']
-            if 'updated_parsed' in entry_dict:
-                del entry_dict['updated_parsed']
-            raw_rss = json.dumps(entry_dict, ensure_ascii=False)
+            # Without the raw XML, store the parsed entry as JSON instead
+            if raw_rss is None:
+                # Convert feedparser entry to dict, removing non-serializable objects
+                entry_dict = dict(entry)
+                # Remove time.struct_time objects that aren't JSON serializable
+                if 'published_parsed' in entry_dict:
+                    del entry_dict['published_parsed']
+                if 'updated_parsed' in entry_dict:
+                    del entry_dict['updated_parsed']
+                raw_rss = json.dumps(entry_dict, ensure_ascii=False)
 
             return {
                 'guid': guid,
@@ -227,52 +508,53 @@ class RSSParser:
             Tuple of (audio_url, file_size_in_bytes)
         """
         # Check enclosures for audio files
-        if hasattr(entry, 'enclosures') and entry.enclosures:
-            for enclosure in entry.enclosures:
-                if enclosure.get('type', '').startswith('audio/'):
-                    url = enclosure.get('href') or enclosure.get('url')
-                    # Try to extract file size (length attribute in RSS)
-                    file_size = None
-                    if 'length' in enclosure:
-                        try:
-                            file_size = int(enclosure['length'])
-                        except (ValueError, TypeError):
-                            logger.debug(f"Could not parse file size: {enclosure.get('length')}")
-                    return url, file_size
+        for enclosure in entry.get('enclosures') or []:
+            mime_type = enclosure.get('type')
+            if mime_type and mime_type.startswith(_AUDIO_MIMES):
+                url = enclosure.get('href') or enclosure.get('url')
+                # Try to extract file size (length attribute in RSS)
+                file_size = None
+                length = enclosure.get('length')
+                if length is not None:
+                    try:
+                        file_size = int(length)
+                    except (ValueError, TypeError):
+                        logger.debug(f"Could not parse file size: {length}")
+                return url, file_size
 
         # Fallback to links (no file size available)
-        if hasattr(entry, 'links'):
-            for link in entry.links:
-                if link.get('type', '').startswith('audio/'):
-                    return link.get('href'), None
+        for link in entry.get('links') or []:
+            mime_type = link.get('type')
+            if mime_type and mime_type.startswith(_AUDIO_MIMES):
+                return link.get('href'), None
 
         return None, None
 
     def _extract_image_url(self, entry) -> Optional[str]:
         """Extract episode image/artwork URL."""
         # Try iTunes image first
-        if hasattr(entry, 'image'):
-            if isinstance(entry.image, dict):
-                return entry.image.get('href')
-            elif isinstance(entry.image, str):
-                return entry.image
+        image = entry.get('image')
+        if isinstance(image, dict):
+            return image.get('href')
+        elif isinstance(image, str):
+            return image
 
         # Try media:thumbnail
-        if hasattr(entry, 'media_thumbnail'):
-            if entry.media_thumbnail and len(entry.media_thumbnail) > 0:
-                return entry.media_thumbnail[0].get('url')
+        thumbnails = entry.get('media_thumbnail')
+        if thumbnails:
+            return thumbnails[0].get('url')
 
         # Try media:content
-        if hasattr(entry, 'media_content'):
-            for media in entry.media_content:
-                if media.get('type', '').startswith('image/'):
-                    return media.get('url')
+        for media in entry.get('media_content') or []:
+            mime_type = media.get('type')
+            if mime_type and mime_type.startswith(_IMAGE_MIMES):
+                return media.get('url')
 
         # Try links
-        if hasattr(entry, 'links'):
-            for link in entry.links:
-                if link.get('type', '').startswith('image/'):
-                    return link.get('href')
+        for link in entry.get('links') or []:
+            mime_type = link.get('type')
+            if mime_type and mime_type.startswith(_IMAGE_MIMES):
+                return link.get('href')
 
         return None
 
@@ -285,46 +567,49 @@ class RSSParser:
         Returns:
             ISO format date string or None if unparseable
         """
-        # Try published_parsed first
-        if hasattr(entry, 'published_parsed') and entry.published_parsed:
-            try:
-                return datetime.fromtimestamp(mktime(entry.published_parsed)).isoformat()
-            except (ValueError, TypeError, OverflowError) as e:
-                logger.debug(f"Could not parse published_parsed: {e}")
+        # Try feedparser's parsed dates first (struct_time, normalized to UTC)
+        for field in ('published_parsed', 'updated_parsed'):
+            parsed = entry.get(field)
+            if parsed:
+                try:
+                    return datetime(*parsed[:6], tzinfo=timezone.utc).isoformat()
+                except (ValueError, TypeError) as e:
+                    logger.debug(f"Could not parse {field}: {e}")
+
+        # Fall back to the raw date strings
+        for field in ('published', 'updated'):
+            date_string = entry.get(field)
+            if date_string:
+                parsed = self._parse_date_string(date_string)
+                if parsed:
+                    return parsed
+                logger.debug(f"Could not parse {field} string: {date_string}")
 
-        # Try updated_parsed
-        if hasattr(entry, 'updated_parsed') and entry.updated_parsed:
-            try:
-                return datetime.fromtimestamp(mktime(entry.updated_parsed)).isoformat()
-            except (ValueError, TypeError, OverflowError) as e:
-                logger.debug(f"Could not parse updated_parsed: {e}")
+        # No date found
+        return None
 
-        # Try parsing published string as ISO format
-        if hasattr(entry, 'published') and entry.published:
-            try:
-                # Try common ISO formats
-                for fmt in ['%Y-%m-%dT%H:%M:%S%z', '%Y-%m-%d %H:%M:%S', '%Y-%m-%d']:
-                    try:
-                        dt = datetime.strptime(entry.published, fmt)
-                        return dt.isoformat()
-                    except ValueError:
-                        continue
-            except:
-                logger.debug(f"Could not parse published string: {entry.published}")
-
-        # Try parsing updated string as ISO format
-        if hasattr(entry, 'updated') and entry.updated:
+    @staticmethod
+    def _parse_date_string(date_string: str) -> Optional[str]:
+        """Parse an RFC 822 or ISO-like date string to ISO format.
+
+        Args:
+            date_string: Date string from the feed
+
+        Returns:
+            ISO format date string or None if unparseable
+        """
+        # RSS dates are RFC 822 ("Tue, 15 Oct 2024 10:00:00 GMT")
+        try:
+            return parsedate_to_datetime(date_string).isoformat()
+        except (TypeError, ValueError, IndexError):
+            pass
+
+        for fmt in _DATE_FORMATS:
             try:
-                for fmt in ['%Y-%m-%dT%H:%M:%S%z', '%Y-%m-%d %H:%M:%S', '%Y-%m-%d']:
-                    try:
-                        dt = datetime.strptime(entry.updated, fmt)
-                        return dt.isoformat()
-                    except ValueError:
-                        continue
-            except:
-                logger.debug(f"Could not parse updated string: {entry.updated}")
+                return datetime.strptime(date_string, fmt).isoformat()
+            except ValueError:
+                continue
 
-        # No date found
         return None
 
     def _parse_duration(self, entry) -> Optional[int]:
@@ -339,9 +624,7 @@ class RSSParser:
             Duration in minutes or None if not found/parseable
         """
         # Try itunes:duration
-        duration = None
-        if hasattr(entry, 'itunes_duration'):
-            duration = entry.itunes_duration
+        duration = entry.get('itunes_duration')
 
         if not duration:
             return None
@@ -354,15 +637,12 @@ class RSSParser:
             # If it's a string, parse it
             duration = str(duration).strip()
 
-            # Check for HH:MM:SS or MM:SS format
-            if ':' in duration:
-                parts = duration.split(':')
-                if len(parts) == 3:  # HH:MM:SS
-                    hours, minutes, seconds = map(int, parts)
-                    return hours * 60 + minutes + (1 if seconds > 0 else 0)
-                elif len(parts) == 2:  # MM:SS
-                    minutes, seconds = map(int, parts)
-                    return minutes + (1 if seconds > 0 else 0)
+            # Check for HH:MM:SS or MM:SS format, rounding up partial minutes
+            match = _DURATION_RE.match(duration)
+            if match:
+                hours, minutes, seconds = match.groups()
+                total_seconds = int(hours or 0) * 3600 + int(minutes) * 60 + int(seconds)
+                return (total_seconds + 59) // 60
 
             # Try parsing as integer seconds
             seconds = int(duration)
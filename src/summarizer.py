@@ -6,6 +6,7 @@ from typing import Optional
 
 # Import LLM provider - change this import to switch providers
 from src.llm import gemini as llm_provider
+from src.llm.cache import ResponseCache
 
 logger = logging.getLogger(__name__)
 
@@ -13,13 +14,17 @@ logger = logging.getLogger(__name__)
 class Summarizer:
     """Orchestrate LLM summarization."""
 
-    def __init__(self, transcript_dir: str = "data/transcripts"):
+    def __init__(self, transcript_dir: str = "data/transcripts",
+                 cache_path: Optional[str] = "data/cache/llm_responses.db"):
         """Initialize summarizer.
 
         Args:
             transcript_dir: Directory containing transcripts
+            cache_path: LLM response cache file, so re-runs reuse existing
+                        summaries (None to disable)
         """
         self.transcript_dir = Path(transcript_dir)
+        self.cache = ResponseCache(cache_path) if cache_path else None
 
         # Gemini configuration
         # For Gemini 3.x models: use thinking_level="high"
@@ -33,7 +38,8 @@ class Summarizer:
                             podcast_slug: str, episode_filename: str,
                             context: Optional[str] = None,
                             podcast_metadata: Optional[dict] = None,
-                            system_prompt: Optional[str] = None) -> Optional[str]:
+                            system_prompt: Optional[str] = None,
+                            force: bool = False) -> Optional[str]:
         """Generate summary from transcript.
 
         Args:
@@ -44,6 +50,7 @@ class Summarizer:
             context: Optional context from episode metadata (participants, topics, etc)
             podcast_metadata: Optional podcast metadata (title, description, categories)
             system_prompt: Optional system-level instruction for the LLM
+            force: Ignore any cached summary and call the LLM again
 
         Returns:
             Path to saved summary file or None if failed
@@ -83,7 +90,10 @@ class Summarizer:
             if context:
                 prompt_parts.append(f"\n\nEpisode Context (from metadata):\n{context}")
 
-            prompt_parts.append(f"Full Transcript:\n\n{transcript}")
+            # Header and transcript are joined with the same "\n\n" separator;
+            # appending them separately avoids an extra copy of the transcript
+            prompt_parts.append("Full Transcript:")
+            prompt_parts.append(transcript)
 
             complete_prompt = "\n\n".join(prompt_parts)
 
@@ -92,24 +102,30 @@ class Summarizer:
                 model=self.model,
                 temperature=self.temperature,
                 thinking_level=self.thinking_level,
-                thinking_budget=self.thinking_budget
+                thinking_budget=self.thinking_budget,
+                cache=self.cache
             )
 
-            summary = llm.run(complete_prompt, system_prompt=system_prompt)
-
-            if not summary:
-                logger.error("LLM returned empty summary")
-                return None
-
-            # Save summary
+            # Save summary, writing it out as the response streams in
             podcast_dir = self.transcript_dir / podcast_slug
             podcast_dir.mkdir(parents=True, exist_ok=True)
 
             summary_filename = f"{episode_filename}.summary.txt"
             summary_path = podcast_dir / summary_filename
 
-            with open(summary_path, 'w', encoding='utf-8') as f:
-                f.write(summary)
+            try:
+                with open(summary_path, 'w', encoding='utf-8') as f:
+                    has_summary = llm.run_to_file(complete_prompt, f, system_prompt=system_prompt,
+                                                   force=force)
+            except Exception:
+                # Don't leave a partial summary behind
+                summary_path.unlink(missing_ok=True)
+                raise
+
+            if not has_summary:
+                logger.error("LLM returned empty summary")
+                summary_path.unlink(missing_ok=True)
+                return None
 
             logger.info(f"Saved summary to: {summary_path}")
             return str(summary_path)
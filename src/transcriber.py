@@ -3,7 +3,8 @@
 import os
 import logging
 from pathlib import Path
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional, Tuple
 import assemblyai as aai
 
 logger = logging.getLogger(__name__)
@@ -26,6 +27,15 @@ class Transcriber:
         aai.settings.api_key = api_key
         aai.settings.polling_interval = 10.0  # Poll every 10 seconds
 
+        # Configure transcription with speaker diarization
+        self.config = aai.TranscriptionConfig(
+            speaker_labels=True,
+            speakers_expected=None  # Auto-detect number of speakers
+        )
+
+        # Reused across calls so its HTTP connections are kept alive
+        self.transcriber = aai.Transcriber(config=self.config)
+
         # Create transcript directory
         self.transcript_dir.mkdir(parents=True, exist_ok=True)
 
@@ -48,33 +58,21 @@ class Transcriber:
             podcast_dir = self.transcript_dir / podcast_slug
             podcast_dir.mkdir(parents=True, exist_ok=True)
 
-            # Configure transcription with speaker diarization
-            config = aai.TranscriptionConfig(
-                speaker_labels=True,
-                speakers_expected=None  # Auto-detect number of speakers
-            )
-
-            # Create transcriber
-            transcriber = aai.Transcriber()
-
             # Transcribe audio (handles upload, submission, and polling internally)
             logger.info("Starting transcription (uploading and processing)...")
-            transcript = transcriber.transcribe(audio_path, config=config)
+            transcript = self.transcriber.transcribe(audio_path, config=self.config)
 
             # Check for errors
             if transcript.status == aai.TranscriptStatus.error:
                 logger.error(f"Transcription failed: {transcript.error}")
                 return None
 
-            # Format transcript with speaker labels
-            formatted_transcript = self._format_transcript(transcript)
-
-            # Save transcript
+            # Save transcript, formatted with speaker labels as it is written
             transcript_filename = f"{episode_filename}.raw.txt"
             transcript_path = podcast_dir / transcript_filename
 
             with open(transcript_path, 'w', encoding='utf-8') as f:
-                f.write(formatted_transcript)
+                f.writelines(self._iter_transcript_parts(transcript))
 
             logger.info(f"Saved transcript to: {transcript_path}")
             return str(transcript_path)
@@ -83,26 +81,49 @@ class Transcriber:
             logger.error(f"Error during transcription: {e}")
             return None
 
-    def _format_transcript(self, transcript) -> str:
-        """Format transcript with speaker labels.
+    def transcribe_batch(self, jobs: List[Tuple[str, str, str]],
+                         max_workers: int = 8) -> List[Optional[str]]:
+        """Transcribe several audio files concurrently.
+
+        Each transcription is dominated by upload and polling waits on
+        AssemblyAI, so running them in parallel threads makes a batch take
+        roughly as long as its slowest file.
 
         Args:
-            transcript: AssemblyAI transcript object
+            jobs: List of (audio_path, podcast_slug, episode_filename) tuples
+            max_workers: Maximum number of concurrent transcriptions
 
         Returns:
-            Formatted transcript string
+            Transcript paths (or None for failures), in the same order as jobs
+        """
+        if not jobs:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs)),
+                                thread_name_prefix="transcribe") as pool:
+            return list(pool.map(lambda job: self.transcribe_audio(*job), jobs))
+
+    def _iter_transcript_parts(self, transcript) -> Iterator[str]:
+        """Format transcript with speaker labels, one piece at a time.
+
+        Yields the transcript incrementally so long transcripts are written
+        without first building the whole formatted string in memory.
+
+        Args:
+            transcript: AssemblyAI transcript object
+
+        Yields:
+            Consecutive pieces of the formatted transcript
         """
         if not transcript.utterances:
             # Fallback to plain text if no speaker diarization
-            return transcript.text
+            yield transcript.text
+            return
 
-        formatted_lines = []
+        separator = ""
         for utterance in transcript.utterances:
-            speaker = utterance.speaker
-            text = utterance.text
-            formatted_lines.append(f"Speaker {speaker}: {text}")
-
-        return "\n\n".join(formatted_lines)
+            yield f"{separator}Speaker {utterance.speaker}: {utterance.text}"
+            separator = "\n\n"
 
     @staticmethod
     def get_transcript_filename(episode_filename: str) -> str:
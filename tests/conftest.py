@@ -1,80 +1,286 @@
 """Pytest configuration and shared fixtures."""
 
 import os
+import copy
+import json
 import pytest
-import tempfile
-import shutil
+import requests
+import feedparser
+from requests.adapters import HTTPAdapter
 from pathlib import Path
+from types import MappingProxyType
+from unittest.mock import Mock
 from src.database import Database
+from src.rss_parser import RSSParser
 from src.config_loader import ConfigLoader
 
 
+# API keys checked for @pytest.mark.requires_api_key when no keys are named
+API_KEY_VARS = ('ASSEMBLYAI_API_KEY', 'OPENAI_API_KEY', 'GEMINI_API_KEY', 'RESEND_API_KEY')
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip requires_api_key tests at collection time when their keys are missing."""
+    for item in items:
+        marker = item.get_closest_marker("requires_api_key")
+        if marker is None:
+            continue
+        missing = [key for key in (marker.args or API_KEY_VARS) if not os.getenv(key)]
+        if missing:
+            item.add_marker(pytest.mark.skip(reason=f"Missing API key(s): {', '.join(missing)}"))
+
+
 @pytest.fixture
-def temp_dir():
-    """Create a temporary directory for test files."""
-    temp_path = tempfile.mkdtemp()
-    yield temp_path
-    shutil.rmtree(temp_path)
+def temp_dir(tmp_path):
+    """Create a temporary directory for test files (cleaned up by pytest)."""
+    return str(tmp_path)
+
+
+@pytest.fixture(scope="session")
+def shared_tmp(tmp_path_factory):
+    """Session-wide temporary directory for tests whose files don't collide."""
+    return tmp_path_factory.mktemp("shared")
 
 
 @pytest.fixture
-def test_db(temp_dir):
-    """Create a test database."""
-    db_path = os.path.join(temp_dir, "test_podcasts.db")
-    db = Database(db_path)
+def transcript_paths(shared_tmp):
+    """Transcript directory for the test podcast under ``shared_tmp``."""
+    base = shared_tmp / "transcripts" / "test-podcast"
+    base.mkdir(parents=True, exist_ok=True)
+    return base
+
+
+class FakeAssemblyAITranscriber:
+    """Stand-in for ``assemblyai.Transcriber`` that records calls.
+
+    Every transcribe() returns the same completed two-speaker transcript.
+    """
+
+    def __init__(self):
+        self.calls = []
+        self.transcript = Mock(
+            status='completed',
+            utterances=[Mock(speaker='A', text='hi'), Mock(speaker='B', text='hello')]
+        )
+
+    def transcribe(self, audio_path, config=None):
+        self.calls.append(audio_path)
+        return self.transcript
+
+
+@pytest.fixture(scope="session")
+def fake_assemblyai():
+    """One fake AssemblyAI transcriber shared by all transcription tests."""
+    return FakeAssemblyAITranscriber()
+
+
+@pytest.fixture(scope="session")
+def template_db():
+    """Build an empty schema-initialized in-memory database once per test session."""
+    db = Database(":memory:")
     db.connect()
     db.initialize_schema()
     yield db
     db.close()
 
 
+@pytest.fixture(scope="session")
+def session_db():
+    """Single in-memory database connection shared by the whole test session."""
+    db = Database(":memory:")
+    db.connect()
+    yield db
+    db.close()
+
+
 @pytest.fixture
-def test_config_files(temp_dir):
-    """Create test configuration files."""
-    # Create test podcasts.yaml
-    podcasts_yaml = os.path.join(temp_dir, "test_podcasts.yaml")
-    podcasts_content = """podcasts:
-  - name: "Test Podcast"
-    slug: "test-podcast"
-    rss_url: "https://feeds.example.com/test"
-    active: true
-    emails:
-      - "test@example.com"
-    insights_prompt: "Test prompt for summaries"
-"""
+def test_db(request, temp_dir, template_db, session_db):
+    """Provide a test database reset to the empty session template.
 
-    with open(podcasts_yaml, 'w') as f:
-        f.write(podcasts_content)
+    Reuses the session's in-memory connection by default, restoring it from
+    the template before each test. Mark a test with ``@pytest.mark.file_db``
+    to get a file-backed database at ``temp_dir/test_podcasts.db`` instead.
+    """
+    if not request.node.get_closest_marker("file_db"):
+        # Discard anything a previous test left uncommitted, then reset
+        session_db.conn.rollback()
+        template_db.conn.backup(session_db.conn)
+        yield session_db
+        return
 
-    # Create test config.yaml
-    config_yaml = os.path.join(temp_dir, "test_config.yaml")
-    config_content = """settings:
-  check_last_n_episodes: 3
-  max_audio_length_minutes: 240
-  archive_retention_days: 15
-  max_audio_file_size_mb: 500
-  max_transcript_retention_days: 365
-  system_email: "admin@example.com"
-
-summary_system_prompt: |
-  You are a podcast summarizer.
-
-summary_default_prompt: |
-  Provide a concise summary of this podcast episode.
-"""
+    db = Database(os.path.join(temp_dir, "test_podcasts.db"))
+    db.connect()
+    template_db.conn.backup(db.conn)
+    yield db
+    db.close()
 
-    with open(config_yaml, 'w') as f:
-        f.write(config_content)
 
-    # Create test .env
-    env_file = os.path.join(temp_dir, "test.env")
-    env_content = """ASSEMBLYAI_API_KEY=test-assemblyai-key
+@pytest.fixture
+def seeded_episode(test_db, sample_episode_data):
+    """Create the test podcast and insert the sample episode.
+
+    Returns:
+        Tuple of (podcast row dict, episode_id)
+    """
+    test_db.sync_podcasts([{'slug': 'test-podcast', 'active': True}])
+    podcast = test_db.get_podcast_by_slug('test-podcast')
+    episode_id = test_db.insert_episode(podcast['id'], sample_episode_data)
+    return podcast, episode_id
+
+
+@pytest.fixture
+def bulk_seed(test_db):
+    """Return a function that inserts episodes and their statuses in one transaction.
+
+    Each entry is ``(episode_data, status, event_data)``; the returned list
+    holds the new episode IDs in the same order.
+    """
+    def _seed(podcast_id, episodes_with_status):
+        with test_db.conn:
+            test_db.conn.executemany("""
+                INSERT INTO episodes (
+                    podcast_id, episode_guid, title, description, link,
+                    audio_url, image_url, published_date
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, [
+                (podcast_id, data['guid'], data.get('title'), data.get('description'),
+                 data.get('link'), data.get('audio_url'), data.get('image_url'),
+                 data.get('published_date'))
+                for data, _, _ in episodes_with_status
+            ])
+            guids = [data['guid'] for data, _, _ in episodes_with_status]
+            ids = dict(test_db.conn.execute(
+                f"SELECT episode_guid, id FROM episodes WHERE episode_guid IN "
+                f"({', '.join('?' * len(guids))})", guids
+            ).fetchall())
+            test_db.conn.executemany("""
+                INSERT INTO processing_events (episode_id, status, event_data)
+                VALUES (?, ?, ?)
+            """, [
+                (ids[data['guid']], status, json.dumps(event_data) if event_data else None)
+                for data, status, event_data in episodes_with_status
+            ])
+        return [ids[guid] for guid in guids]
+    return _seed
+
+
+CHANGELOG_RSS_URL = "https://feeds.simplecast.com/54nAGcIl"  # The Changelog podcast
+
+
+@pytest.fixture(scope="session")
+def http_session():
+    """Pooled HTTP session shared by the network-bound tests."""
+    session = requests.Session()
+    session.headers['User-Agent'] = feedparser.USER_AGENT
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    yield session
+    session.close()
+
+
+@pytest.fixture(scope="session")
+def changelog_episodes(request, http_session):
+    """Latest episodes of a stable public feed, fetched once per session.
+
+    Set REUSE_FEED_CACHE=1 to keep the parsed episodes in pytest's cache and
+    reuse them on later runs (e.g. offline). Off by default, since cached
+    episodes would no longer exercise RSSParser.
+    """
+    cache = getattr(request.config, "cache", None) if os.getenv("REUSE_FEED_CACHE") else None
+    cache_key = "podcast_summary/changelog_episodes"
+
+    episodes = cache.get(cache_key, None) if cache else None
+    if episodes is None:
+        episodes, _ = RSSParser(max_audio_length_minutes=240, session=http_session).fetch_episodes(
+            CHANGELOG_RSS_URL, check_last_n=3
+        )
+        if cache:
+            cache.set(cache_key, episodes)
+    return episodes
+
+
+TEST_ENV = """ASSEMBLYAI_API_KEY=test-assemblyai-key
 OPENAI_API_KEY=test-openai-key
 RESEND_API_KEY=test-resend-key
 """
 
+def write_yaml(path, data):
+    """Write a dict to a YAML file.
+
+    Serialized as JSON, which is valid YAML and much cheaper to produce.
+    """
+    with open(path, 'w') as f:
+        json.dump(data, f)
+
+
+@pytest.fixture(scope="session")
+def base_config_dict():
+    """Valid podcasts.yaml and config.yaml contents, built once per session.
+
+    Shared across tests: use ``config_dicts`` for a copy that is safe to mutate.
+    """
+    return {
+        'podcasts': {
+            'podcasts': [{
+                'name': "Test Podcast",
+                'slug': "test-podcast",
+                'rss_url': "https://feeds.example.com/test",
+                'active': True,
+                'emails': ["test@example.com"],
+                'insights_prompt': "Test prompt for summaries",
+            }]
+        },
+        'config': {
+            'settings': {
+                'check_last_n_episodes': 3,
+                'max_audio_length_minutes': 240,
+                'archive_retention_days': 15,
+                'max_audio_file_size_mb': 500,
+                'max_transcript_retention_days': 365,
+                'system_email': "admin@example.com",
+            },
+            'summary_system_prompt': "You are a podcast summarizer.\n",
+            'summary_default_prompt': "Provide a concise summary of this podcast episode.\n",
+        },
+    }
+
+
+@pytest.fixture
+def config_dicts(base_config_dict):
+    """Per-test copy of the valid config dicts that tests can mutate."""
+    return copy.deepcopy(base_config_dict)
+
+
+@pytest.fixture
+def make_config_loader():
+    """Return a function that builds an in-memory ConfigLoader from config dicts.
+
+    The dicts are passed as JSON, which ConfigLoader parses as YAML.
+    """
+    def _make(podcasts, config, env_content=TEST_ENV):
+        return ConfigLoader.from_strings(
+            json.dumps(podcasts),
+            json.dumps(config),
+            env_content
+        )
+    return _make
+
+
+@pytest.fixture(scope="session")
+def test_config_files(tmp_path_factory, base_config_dict):
+    """Create test configuration files once per session (treat as read-only)."""
+    temp_dir = str(tmp_path_factory.mktemp("cfg"))
+
+    podcasts_yaml = os.path.join(temp_dir, "test_podcasts.yaml")
+    write_yaml(podcasts_yaml, base_config_dict['podcasts'])
+
+    config_yaml = os.path.join(temp_dir, "test_config.yaml")
+    write_yaml(config_yaml, base_config_dict['config'])
+
+    env_file = os.path.join(temp_dir, "test.env")
     with open(env_file, 'w') as f:
-        f.write(env_content)
+        f.write(TEST_ENV)
 
     return {
         'podcasts_yaml': podcasts_yaml,
@@ -94,19 +300,29 @@ def test_config_loader(test_config_files):
     return loader
 
 
+_BASE_EPISODE = MappingProxyType({
+    'guid': 'test-episode-guid-123',
+    'title': 'Test Episode Title',
+    'description': 'Test episode description',
+    'link': 'https://example.com/episode',
+    'audio_url': 'https://example.com/audio.mp3',
+    'image_url': 'https://example.com/image.jpg',
+    'published_date': '2024-01-15 10:00:00'
+})
+
+
 @pytest.fixture
 def sample_episode_data():
     """Sample episode data for testing."""
-    return {
-        'guid': 'test-episode-guid-123',
-        'title': 'Test Episode Title',
-        'description': 'Test episode description',
-        'link': 'https://example.com/episode',
-        'audio_url': 'https://example.com/audio.mp3',
-        'image_url': 'https://example.com/image.jpg',
-        'published_date': '2024-01-15 10:00:00',
-        'raw_rss': '<item>...</item>'
-    }
+    return dict(_BASE_EPISODE)
+
+
+@pytest.fixture
+def make_episode():
+    """Return a factory building sample episode data with the given GUID and overrides."""
+    def _make(guid, **overrides):
+        return _BASE_EPISODE | {'guid': guid, **overrides}
+    return _make
 
 
 @pytest.fixture
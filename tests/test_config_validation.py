@@ -7,9 +7,7 @@ As described in PLAN_MASTERPLAN.md, these tests verify:
 4. Valid config → passes validation
 """
 
-import os
 import pytest
-from src.config_loader import ConfigLoader, ConfigError
 
 
 def test_valid_config(test_config_loader):
@@ -20,177 +18,50 @@ def test_valid_config(test_config_loader):
     assert test_config_loader.get_default_prompt() != ""
 
 
-def test_missing_required_field_in_podcasts(temp_dir):
-    """Test that missing required field in podcasts.yaml raises ConfigError."""
-    # Create invalid podcasts.yaml (missing 'slug')
-    podcasts_yaml = os.path.join(temp_dir, "invalid_podcasts.yaml")
-    with open(podcasts_yaml, 'w') as f:
-        f.write("""podcasts:
-  - name: "Test Podcast"
-    rss_url: "https://example.com/feed"
-    active: true
-""")
-
-    config_yaml = os.path.join(temp_dir, "config.yaml")
-    with open(config_yaml, 'w') as f:
-        f.write("""settings:
-  check_last_n_episodes: 3
-  system_email: "admin@example.com"
-summary_system_prompt: "System prompt"
-summary_default_prompt: "Test prompt"
-""")
-
-    env_file = os.path.join(temp_dir, "test.env")
-    with open(env_file, 'w') as f:
-        f.write("""ASSEMBLYAI_API_KEY=test-key
-OPENAI_API_KEY=test-key
-RESEND_API_KEY=test-key
-""")
-
-    loader = ConfigLoader(podcasts_yaml, config_yaml, env_file)
-    result = loader.load_all()
-    assert result is False
-
-
-def test_invalid_email_format_in_podcasts(temp_dir):
-    """Test that invalid email format in podcasts.yaml raises ConfigError."""
-    podcasts_yaml = os.path.join(temp_dir, "invalid_podcasts.yaml")
-    with open(podcasts_yaml, 'w') as f:
-        f.write("""podcasts:
-  - name: "Test Podcast"
-    slug: "test-podcast"
-    rss_url: "https://example.com/feed"
-    active: true
-    emails:
-      - "invalid-email"
-""")
-
-    config_yaml = os.path.join(temp_dir, "config.yaml")
-    with open(config_yaml, 'w') as f:
-        f.write("""settings:
-  check_last_n_episodes: 3
-  system_email: "admin@example.com"
-summary_system_prompt: "System prompt"
-summary_default_prompt: "Test prompt"
-""")
-
-    env_file = os.path.join(temp_dir, "test.env")
-    with open(env_file, 'w') as f:
-        f.write("""ASSEMBLYAI_API_KEY=test-key
-OPENAI_API_KEY=test-key
-RESEND_API_KEY=test-key
-""")
-
-    loader = ConfigLoader(podcasts_yaml, config_yaml, env_file)
-    result = loader.load_all()
-    assert result is False
-
-
-def test_missing_api_key(temp_dir, monkeypatch):
-    """Test that missing API key raises ConfigError."""
-    # Clear all API keys from environment to ensure clean state
-    monkeypatch.delenv('ASSEMBLYAI_API_KEY', raising=False)
-    monkeypatch.delenv('OPENAI_API_KEY', raising=False)
-    monkeypatch.delenv('GEMINI_API_KEY', raising=False)
-    monkeypatch.delenv('RESEND_API_KEY', raising=False)
-
-    podcasts_yaml = os.path.join(temp_dir, "podcasts.yaml")
-    with open(podcasts_yaml, 'w') as f:
-        f.write("""podcasts:
-  - name: "Test Podcast"
-    slug: "test-podcast"
-    rss_url: "https://example.com/feed"
-    active: true
-    emails:
-      - "test@example.com"
-""")
-
-    config_yaml = os.path.join(temp_dir, "config.yaml")
-    with open(config_yaml, 'w') as f:
-        f.write("""settings:
-  check_last_n_episodes: 3
-  system_email: "admin@example.com"
-summary_system_prompt: "System prompt"
-summary_default_prompt: "Test prompt"
-""")
-
-    # Missing ASSEMBLYAI_API_KEY
-    env_file = os.path.join(temp_dir, "test.env")
-    with open(env_file, 'w') as f:
-        f.write("""OPENAI_API_KEY=test-key
-RESEND_API_KEY=test-key
-""")
-
-    loader = ConfigLoader(podcasts_yaml, config_yaml, env_file)
-    result = loader.load_all()
-    assert result is False
-
-
-def test_duplicate_slug_validation(temp_dir):
-    """Test that duplicate slugs are caught during validation."""
-    podcasts_yaml = os.path.join(temp_dir, "invalid_podcasts.yaml")
-    with open(podcasts_yaml, 'w') as f:
-        f.write("""podcasts:
-  - name: "Podcast 1"
-    slug: "test-podcast"
-    rss_url: "https://example1.com/feed"
-    active: true
-  - name: "Podcast 2"
-    slug: "test-podcast"
-    rss_url: "https://example2.com/feed"
-    active: true
-""")
-
-    config_yaml = os.path.join(temp_dir, "config.yaml")
-    with open(config_yaml, 'w') as f:
-        f.write("""settings:
-  check_last_n_episodes: 3
-  system_email: "admin@example.com"
-summary_system_prompt: "System prompt"
-summary_default_prompt: "Test prompt"
-""")
-
-    env_file = os.path.join(temp_dir, "test.env")
-    with open(env_file, 'w') as f:
-        f.write("""ASSEMBLYAI_API_KEY=test-key
-OPENAI_API_KEY=test-key
-RESEND_API_KEY=test-key
-""")
-
-    loader = ConfigLoader(podcasts_yaml, config_yaml, env_file)
-    result = loader.load_all()
-    assert result is False
-
-
-def test_invalid_system_email(temp_dir):
-    """Test that invalid system_email format is caught."""
-    podcasts_yaml = os.path.join(temp_dir, "podcasts.yaml")
-    with open(podcasts_yaml, 'w') as f:
-        f.write("""podcasts:
-  - name: "Test Podcast"
-    slug: "test-podcast"
-    rss_url: "https://example.com/feed"
-    active: true
-    emails:
-      - "test@example.com"
-""")
-
-    config_yaml = os.path.join(temp_dir, "config.yaml")
-    with open(config_yaml, 'w') as f:
-        f.write("""settings:
-  check_last_n_episodes: 3
-  system_email: "not-an-email"
-summary_system_prompt: "System prompt"
-summary_default_prompt: "Test prompt"
-""")
-
-    env_file = os.path.join(temp_dir, "test.env")
-    with open(env_file, 'w') as f:
-        f.write("""ASSEMBLYAI_API_KEY=test-key
-OPENAI_API_KEY=test-key
-RESEND_API_KEY=test-key
-""")
-
-    loader = ConfigLoader(podcasts_yaml, config_yaml, env_file)
-    result = loader.load_all()
-    assert result is False
+def _remove_slug(podcasts, config, env):
+    del podcasts['podcasts'][0]['slug']
+
+
+def _invalid_podcast_email(podcasts, config, env):
+    podcasts['podcasts'][0]['emails'] = ["invalid-email"]
+
+
+def _missing_assemblyai_key(podcasts, config, env):
+    del env['ASSEMBLYAI_API_KEY']
+
+
+def _duplicate_slug(podcasts, config, env):
+    first = podcasts['podcasts'][0]
+    podcasts['podcasts'].append(dict(first, name="Podcast 2",
+                                     rss_url="https://example2.com/feed"))
+
+
+def _invalid_system_email(podcasts, config, env):
+    config['settings']['system_email'] = "not-an-email"
+
+
+@pytest.mark.parametrize("mutation", [
+    pytest.param(_remove_slug, id="missing-required-field"),
+    pytest.param(_invalid_podcast_email, id="invalid-podcast-email"),
+    pytest.param(_missing_assemblyai_key, id="missing-api-key"),
+    pytest.param(_duplicate_slug, id="duplicate-slug"),
+    pytest.param(_invalid_system_email, id="invalid-system-email"),
+])
+def test_invalid_config(config_dicts, make_config_loader, monkeypatch, mutation):
+    """Test that each invalid variation of the valid config fails validation."""
+    # Clear all API keys from environment so only the test .env applies
+    for key in ('ASSEMBLYAI_API_KEY', 'OPENAI_API_KEY', 'GEMINI_API_KEY', 'RESEND_API_KEY'):
+        monkeypatch.delenv(key, raising=False)
+
+    env = {
+        'ASSEMBLYAI_API_KEY': "test-key",
+        'OPENAI_API_KEY': "test-key",
+        'RESEND_API_KEY': "test-key",
+    }
+    mutation(config_dicts['podcasts'], config_dicts['config'], env)
+
+    loader = make_config_loader(
+        config_dicts['podcasts'], config_dicts['config'],
+        env_content="".join(f"{key}={value}\n" for key, value in env.items())
+    )
+    assert loader.load_all() is False
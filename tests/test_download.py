@@ -10,7 +10,12 @@ Note: These are integration tests that require internet access to fetch real RSS
 Mark as @pytest.mark.integration if you want to skip in CI.
 """
 
+import json
+import time
+
+import feedparser
 import pytest
+import requests
 from src.rss_parser import RSSParser
 from src.downloader import Downloader
 from src.database import Database
@@ -53,18 +58,317 @@ def test_sanitize_filename_no_date():
     assert len(filename) > len("episode-title.mp3")
 
 
+def test_trim_feed_keeps_leading_items():
+    """Test that trimmed feeds parse to the same leading entries."""
+    items = "".join(
+        f"<item><title>Episode {i}</title><guid>guid-{i}</guid>"
+        f"<enclosure url='https://example.com/{i}.mp3' type='audio/mpeg'/></item>"
+        for i in range(10)
+    )
+    content = (f"<?xml version='1.0'?><rss version='2.0'><channel>"
+               f"<title>Podcast</title>{items}</channel></rss>").encode()
+
+    trimmed = RSSParser._trim_feed(content, 3)
+    assert len(trimmed) < len(content)
+
+    feed = feedparser.parse(trimmed)
+    assert not feed.bozo
+    assert feed.feed.title == "Podcast"
+    assert [e.id for e in feed.entries] == ["guid-0", "guid-1", "guid-2"]
+
+    # Feeds with no more than max_items are left untouched
+    assert RSSParser._trim_feed(content, 10) == content
+
+
+def _rss(count):
+    """Build an RSS document with the given number of items."""
+    items = "".join(
+        f"<item><title>Episode {i}</title><guid>guid-{i}</guid>"
+        f"<enclosure url='https://example.com/{i}.mp3' type='audio/mpeg'/></item>"
+        for i in range(count)
+    )
+    return (f"<?xml version='1.0'?><rss version='2.0'><channel>"
+            f"<title>Podcast</title>{items}</channel></rss>").encode()
+
+
+class FakeResponse:
+    """Streaming response stand-in that yields its body in fixed chunks."""
+
+    def __init__(self, url, status_code=200, body=b"", headers=None, chunk_size=None):
+        self.url = url
+        self.status_code = status_code
+        self.body = body
+        self.headers = headers or {}
+        self.chunk_size = chunk_size
+        self.chunks_read = 0
+
+    def iter_content(self, chunk_size):
+        size = self.chunk_size or chunk_size
+        for start in range(0, len(self.body), size):
+            self.chunks_read += 1
+            yield self.body[start:start + size]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class FakeSession:
+    """Session stand-in that serves canned responses and records requests."""
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.requests = []
+
+    def get(self, url, headers=None, **kwargs):
+        self.requests.append((url, headers or {}))
+        response = self.responses[url]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def test_fetch_episodes_sends_validators_and_handles_not_modified():
+    """Test conditional GETs: validators are sent and a 304 yields nothing."""
+    url = "https://example.com/feed.xml"
+    session = FakeSession({url: FakeResponse(url, status_code=304)})
+    parser = RSSParser(session=session)
+
+    result = parser.fetch_episodes(url, etag='"abc"', last_modified="Mon, 01 Jan 2024 00:00:00 GMT")
+
+    assert result == ([], {})
+    assert session.requests == [(url, {
+        'If-None-Match': '"abc"',
+        'If-Modified-Since': "Mon, 01 Jan 2024 00:00:00 GMT",
+    })]
+    # A 304 carries no new validators
+    assert url not in parser.feed_validators
+    assert url in parser.not_modified
+
+
+def test_fetch_episodes_records_validators_on_success():
+    """Test that a 200 response stores the feed's ETag and Last-Modified."""
+    url = "https://example.com/feed.xml"
+    headers = {'ETag': '"v2"', 'Last-Modified': "Tue, 02 Jan 2024 00:00:00 GMT"}
+    session = FakeSession({url: FakeResponse(url, body=_rss(5), headers=headers)})
+    parser = RSSParser(session=session)
+
+    episodes, metadata = parser.fetch_episodes(url, check_last_n=2)
+
+    assert [e['title'] for e in episodes] == ["Episode 0", "Episode 1"]
+    assert metadata['title'] == "Podcast"
+    # No validators were given, so the request is unconditional
+    assert session.requests == [(url, {})]
+    assert parser.feed_validators[url] == {
+        'etag': '"v2"', 'last_modified': "Tue, 02 Jan 2024 00:00:00 GMT",
+    }
+    assert url not in parser.not_modified
+
+
+def test_read_feed_stops_after_needed_items():
+    """Test that streaming stops once one item past max_items has arrived."""
+    body = _rss(50)
+    response = FakeResponse("https://example.com/feed.xml", body=body, chunk_size=64)
+    parser = RSSParser()
+
+    content = parser._read_feed(response, max_items=3)
+
+    assert body.startswith(content)
+    assert len(content) < len(body)
+    assert content.count(b"</item>") == 4
+    # Trimming the partial read yields a complete, parseable document
+    feed = feedparser.parse(RSSParser._trim_feed(content, 3))
+    assert [e.title for e in feed.entries] == ["Episode 0", "Episode 1", "Episode 2"]
+
+
+def test_read_feed_counts_close_tags_split_across_chunks():
+    """Test that a close tag straddling two chunks is still counted once."""
+    body = _rss(6)
+    # Chunk boundaries land inside every "</item>" at some point
+    for chunk_size in range(1, 12):
+        response = FakeResponse("https://example.com/feed.xml", body=body, chunk_size=chunk_size)
+        content = RSSParser()._read_feed(response, max_items=2)
+        assert content.count(b"</item>") == 3, chunk_size
+
+
+def test_read_feed_handles_atom_feeds():
+    """Test that Atom feeds are cut short on </entry> close tags."""
+    entries = "".join(
+        f"<entry><title>Entry {i}</title><id>urn:entry:{i}</id></entry>" for i in range(20)
+    )
+    body = (f"<?xml version='1.0'?><feed xmlns='http://www.w3.org/2005/Atom'>"
+            f"<title>Atom Podcast</title>{entries}</feed>").encode()
+    response = FakeResponse("https://example.com/atom.xml", body=body, chunk_size=50)
+
+    content = RSSParser()._read_feed(response, max_items=2)
+
+    assert len(content) < len(body)
+    assert content.count(b"</entry>") == 3
+    trimmed = RSSParser._trim_feed(content, 2)
+    assert trimmed.endswith(b"</feed>")
+    assert [e.title for e in feedparser.parse(trimmed).entries] == ["Entry 0", "Entry 1"]
+
+
+def test_read_feed_reads_everything_without_max_items():
+    """Test that the whole body is read when no item limit is given."""
+    body = _rss(10)
+    response = FakeResponse("https://example.com/feed.xml", body=body, chunk_size=64)
+
+    assert RSSParser()._read_feed(response) == body
+
+
+def test_split_raw_items_keeps_item_xml():
+    """Test that each episode's raw_rss is the exact <item> XML from the feed."""
+    url = "https://example.com/feed.xml"
+    session = FakeSession({url: FakeResponse(url, body=_rss(3))})
+
+    episodes, _ = RSSParser(session=session).fetch_episodes(url, check_last_n=3)
+
+    assert [e['raw_rss'] for e in episodes] == [
+        f"<item><title>Episode {i}</title><guid>guid-{i}</guid>"
+        f"<enclosure url='https://example.com/{i}.mp3' type='audio/mpeg'/></item>"
+        for i in range(3)
+    ]
+
+
+def test_split_raw_items_falls_back_to_json_on_mismatch():
+    """Test that raw_rss falls back to JSON when items can't be matched up."""
+    # Markup inside a CDATA channel description looks like an extra item
+    # to the raw splitter, so the counts no longer line up
+    body = (b"<?xml version='1.0'?><rss version='2.0'><channel><title>Podcast</title>"
+            b"<description><![CDATA[<item>not an episode</item>]]></description>"
+            b"<item><title>Episode 0</title><guid>guid-0</guid>"
+            b"<enclosure url='https://example.com/0.mp3' type='audio/mpeg'/></item>"
+            b"</channel></rss>")
+    feed = feedparser.parse(body)
+    assert RSSParser._split_raw_items(body, feed) is None
+
+    url = "https://example.com/feed.xml"
+    session = FakeSession({url: FakeResponse(url, body=body)})
+    episodes, _ = RSSParser(session=session).fetch_episodes(url, check_last_n=3)
+
+    raw = json.loads(episodes[0]['raw_rss'])
+    assert raw['title'] == "Episode 0"
+
+
+def test_fetch_episodes_many_isolates_failures():
+    """Test concurrent fetching: per-URL results, errors and validators."""
+    ok_url = "https://example.com/ok.xml"
+    bad_url = "https://example.com/bad.xml"
+    cached_url = "https://example.com/cached.xml"
+    session = FakeSession({
+        ok_url: FakeResponse(ok_url, body=_rss(3)),
+        bad_url: requests.ConnectionError("connection refused"),
+        cached_url: FakeResponse(cached_url, status_code=304),
+    })
+    parser = RSSParser(session=session)
+
+    results = parser.fetch_episodes_many(
+        [ok_url, bad_url, cached_url, ok_url],
+        check_last_n=2,
+        validators={cached_url: {'etag': '"v1"', 'last_modified': None}}
+    )
+
+    assert list(results) == [ok_url, bad_url, cached_url]
+    episodes, metadata = results[ok_url]
+    assert len(episodes) == 2
+    assert metadata['title'] == "Podcast"
+    assert isinstance(results[bad_url], Exception)
+    assert "connection refused" in str(results[bad_url])
+    assert results[cached_url] == ([], {})
+
+    # Duplicate URLs are fetched once; only the cached feed is conditional
+    requested = dict(session.requests)
+    assert len(session.requests) == 3
+    assert requested[ok_url] == {}
+    assert requested[cached_url] == {'If-None-Match': '"v1"'}
+
+
+@pytest.mark.parametrize("date_string, expected", [
+    ("Tue, 15 Oct 2024 10:00:00 GMT", "2024-10-15T10:00:00+00:00"),
+    ("Tue, 15 Oct 2024 10:00:00 -0500", "2024-10-15T10:00:00-05:00"),
+    ("2024-10-15T10:00:00Z", "2024-10-15T10:00:00+00:00"),
+    ("2024-10-15T10:00:00+0200", "2024-10-15T10:00:00+02:00"),
+    ("2024-10-15 10:00:00", "2024-10-15T10:00:00"),
+    ("2024-10-15", "2024-10-15T00:00:00"),
+    ("not a date", None),
+    ("", None),
+])
+def test_parse_date_string(date_string, expected):
+    """Test RFC 822 and ISO-like date strings, with and without offsets."""
+    assert RSSParser._parse_date_string(date_string) == expected
+
+
+def test_parse_published_date_falls_back_to_strings():
+    """Test that raw date strings are used when feedparser couldn't parse them."""
+    parser = RSSParser()
+
+    assert parser._parse_published_date(
+        {'published': "garbage", 'updated': "2024-10-15T10:00:00Z"}
+    ) == "2024-10-15T10:00:00+00:00"
+    assert parser._parse_published_date({'published': "garbage"}) is None
+    assert parser._parse_published_date({}) is None
+
+
+def test_parse_published_date_from_struct_time_is_utc(monkeypatch):
+    """Test that feedparser's UTC struct_time dates aren't shifted by local time."""
+    # Run on a host clock far from UTC; the result must not depend on it
+    monkeypatch.setenv("TZ", "America/Los_Angeles")
+    time.tzset()
+    try:
+        body = (b"<?xml version='1.0'?><rss version='2.0'><channel><title>Podcast</title>"
+                b"<item><title>Episode</title><pubDate>Tue, 15 Oct 2024 12:00:00 +0200</pubDate>"
+                b"</item></channel></rss>")
+        entry = feedparser.parse(body).entries[0]
+
+        assert isinstance(entry.published_parsed, time.struct_time)
+        assert RSSParser()._parse_published_date(entry) == "2024-10-15T10:00:00+00:00"
+    finally:
+        monkeypatch.undo()
+        time.tzset()
+
+
+@pytest.mark.parametrize("duration, expected", [
+    ("3600", 60),
+    ("90", 1),
+    (125, 2),
+    ("45:00", 45),
+    ("45:01", 46),
+    ("01:00:01", 61),
+    ("1:02:03", 63),
+    (" 30:00 ", 30),
+    ("bad", None),
+    ("1:2:3:4", None),
+    ("", None),
+    (None, None),
+])
+def test_parse_duration(duration, expected):
+    """Test itunes:duration parsing to minutes (partial clock minutes round up)."""
+    assert RSSParser()._parse_duration({'itunes_duration': duration}) == expected
+
+
+def test_fetch_episodes_never_opens_body_as_path(tmp_path):
+    """Test that a feed body naming a local file isn't read from disk."""
+    local_feed = tmp_path / "local.xml"
+    local_feed.write_bytes(_rss(2))
+    url = "https://example.com/feed.xml"
+    session = FakeSession({url: FakeResponse(url, body=str(local_feed).encode())})
+
+    episodes, metadata = RSSParser(session=session).fetch_episodes(url)
+
+    assert (episodes, metadata) == ([], {})
+
+
 @pytest.mark.integration
-def test_fetch_rss_episodes():
+def test_fetch_rss_episodes(changelog_episodes):
     """Integration test: Fetch episodes from a real RSS feed.
 
     This test uses a well-known podcast RSS feed to verify RSS parsing works.
     Skip this test if you don't have internet access.
     """
-    # Using a stable, public podcast feed
-    rss_url = "https://feeds.simplecast.com/54nAGcIl"  # The Changelog podcast
-
-    parser = RSSParser(max_audio_length_minutes=240)
-    episodes = parser.fetch_episodes(rss_url, check_last_n=3)
+    episodes = changelog_episodes
 
     assert len(episodes) > 0
     assert len(episodes) <= 3
@@ -78,16 +382,12 @@ def test_fetch_rss_episodes():
 
 
 @pytest.mark.integration
-def test_download_episode_flow(test_db, temp_dir):
+def test_download_episode_flow(test_db, temp_dir, changelog_episodes):
     """Integration test: Download episode and verify database updates.
 
     This test downloads a real episode and verifies the complete flow.
     Note: This downloads actual audio files, so it may take time and bandwidth.
     """
-    # Setup
-    rss_url = "https://feeds.simplecast.com/54nAGcIl"
-    parser = RSSParser(max_audio_length_minutes=240)
-
     # Create downloader with temp directory
     downloader = Downloader(
         download_dir=f"{temp_dir}/audio/downloaded",
@@ -106,11 +406,9 @@ def test_download_episode_flow(test_db, temp_dir):
     podcast = test_db.get_podcast_by_slug('test-podcast')
     assert podcast is not None
 
-    # Fetch episodes from RSS
-    episodes = parser.fetch_episodes(rss_url, check_last_n=1)
-    assert len(episodes) > 0
-
-    episode_data = episodes[0]
+    # Latest episode from RSS
+    assert len(changelog_episodes) > 0
+    episode_data = changelog_episodes[0]
 
     # Insert episode into database
     episode_id = test_db.insert_episode(podcast['id'], episode_data)
@@ -119,8 +417,8 @@ def test_download_episode_flow(test_db, temp_dir):
     # Verify episode was inserted
     db_episode = test_db.get_episode_by_id(episode_id)
     assert db_episode is not None
-    assert db_episode['title'] == episode_data['title']
-    assert db_episode['audio_url'] == episode_data['audio_url']
+    assert (db_episode['title'], db_episode['audio_url']) == \
+        (episode_data['title'], episode_data['audio_url'])
     assert db_episode['image_url'] is not None or episode_data.get('image_url') is None
     assert db_episode['raw_rss'] is not None
 
@@ -10,12 +10,15 @@ Note: This is a comprehensive integration test that requires:
 - Valid API keys (AssemblyAI, OpenAI/Gemini, Resend)
 - Internet access
 - Significant time to complete
-Mark as @pytest.mark.e2e
+Mark as @pytest.mark.e2e; set RUN_E2E=1 to run.
 """
 
 import pytest
 import os
 
+# Skip the whole module (before any fixtures are set up) unless explicitly enabled
+pytestmark = pytest.mark.skipif(not os.getenv("RUN_E2E"), reason="E2E disabled (set RUN_E2E=1)")
+
 
 @pytest.mark.e2e
 @pytest.mark.requires_api_key
@@ -33,7 +36,7 @@ def test_full_pipeline():
 
     Skip this test unless you have all API keys and want to test the full system.
     """
-    pytest.skip("Requires all API keys and is time-consuming")
+    pytest.skip("Placeholder - test flow not implemented yet")
 
     # This is a placeholder showing the expected test flow:
     # import sys
@@ -13,12 +13,10 @@ import pytest
 from datetime import datetime, timedelta
 
 
-def test_failed_episode_marked_in_db(test_db, sample_episode_data):
+def test_failed_episode_marked_in_db(test_db, seeded_episode):
     """Test that failed episodes are marked with error message."""
     # Create podcast and episode
-    test_db.sync_podcasts([{'slug': 'test-podcast', 'active': True}])
-    podcast = test_db.get_podcast_by_slug('test-podcast')
-    episode_id = test_db.insert_episode(podcast['id'], sample_episode_data)
+    _, episode_id = seeded_episode
 
     # Simulate failure during processing
     error_message = "Failed to transcribe: API timeout"
@@ -37,44 +35,32 @@ def test_failed_episode_marked_in_db(test_db, sample_episode_data):
     assert failed_event_data['failed_stage'] == 'transcribe'
 
 
-def test_failed_episodes_query(test_db, sample_episode_data):
+def test_failed_episodes_query(test_db, bulk_seed, make_episode):
     """Test that failed episodes can be retrieved for error reporting."""
     # Create podcast and episodes
     test_db.sync_podcasts([{'slug': 'test-podcast', 'active': True}])
     podcast = test_db.get_podcast_by_slug('test-podcast')
 
-    # Create successful episode
-    episode_data_1 = sample_episode_data.copy()
-    episode_data_1['guid'] = 'success-guid'
-    episode_id_1 = test_db.insert_episode(podcast['id'], episode_data_1)
-    test_db.add_processing_event(episode_id_1, 'completed')
-
-    # Create failed episode
-    episode_data_2 = sample_episode_data.copy()
-    episode_data_2['guid'] = 'failed-guid'
-    episode_data_2['title'] = 'Failed Episode'
-    episode_id_2 = test_db.insert_episode(podcast['id'], episode_data_2)
-    test_db.add_processing_event(
-        episode_id_2,
-        'failed',
-        event_data={'error_message': 'Transcription API error', 'failed_stage': 'transcribe'}
-    )
+    # Create one successful and one failed episode
+    bulk_seed(podcast['id'], [
+        (make_episode('success-guid'), 'completed', None),
+        (make_episode('failed-guid', title='Failed Episode'), 'failed',
+         {'error_message': 'Transcription API error', 'failed_stage': 'transcribe'}),
+    ])
 
     # Query failed episodes
     failed_episodes = test_db.get_failed_episodes(hours=24)
 
-    assert len(failed_episodes) == 1
-    assert failed_episodes[0]['podcast_slug'] == 'test-podcast'
-    assert failed_episodes[0]['episode_title'] == 'Failed Episode'
-    assert failed_episodes[0]['error_message'] == 'Transcription API error'
+    assert [(e['podcast_slug'], e['episode_title'], e['error_message'])
+            for e in failed_episodes] == [
+        ('test-podcast', 'Failed Episode', 'Transcription API error')
+    ]
 
 
-def test_failed_episode_not_retried(test_db, sample_episode_data):
+def test_failed_episode_not_retried(test_db, seeded_episode):
     """Test that failed episodes remain failed and are not retried."""
     # Create podcast and episode
-    test_db.sync_podcasts([{'slug': 'test-podcast', 'active': True}])
-    podcast = test_db.get_podcast_by_slug('test-podcast')
-    episode_id = test_db.insert_episode(podcast['id'], sample_episode_data)
+    _, episode_id = seeded_episode
 
     # Mark as failed
     test_db.add_processing_event(
@@ -94,39 +80,23 @@ def test_failed_episode_not_retried(test_db, sample_episode_data):
     assert should_skip is True
 
 
-def test_failure_isolation(test_db, sample_episode_data):
+def test_failure_isolation(test_db, bulk_seed, make_episode):
     """Test that one failed episode doesn't block processing of others."""
     # Create podcast
     test_db.sync_podcasts([{'slug': 'test-podcast', 'active': True}])
     podcast = test_db.get_podcast_by_slug('test-podcast')
 
-    # Create two episodes
-    episode_data_1 = sample_episode_data.copy()
-    episode_data_1['guid'] = 'episode-1'
-    episode_data_1['title'] = 'Episode 1'
-    episode_id_1 = test_db.insert_episode(podcast['id'], episode_data_1)
-
-    episode_data_2 = sample_episode_data.copy()
-    episode_data_2['guid'] = 'episode-2'
-    episode_data_2['title'] = 'Episode 2'
-    episode_id_2 = test_db.insert_episode(podcast['id'], episode_data_2)
-
-    # Mark first as failed
-    test_db.add_processing_event(
-        episode_id_1,
-        'failed',
-        event_data={'error_message': 'Test error', 'failed_stage': 'download'}
-    )
-
-    # Mark second as completed
-    test_db.add_processing_event(episode_id_2, 'completed')
+    # Create two episodes: first failed, second completed
+    episode_id_1, episode_id_2 = bulk_seed(podcast['id'], [
+        (make_episode('episode-1', title='Episode 1'), 'failed',
+         {'error_message': 'Test error', 'failed_stage': 'download'}),
+        (make_episode('episode-2', title='Episode 2'), 'completed', None),
+    ])
 
     # Verify both have correct statuses
-    status_1 = test_db.get_current_status(episode_id_1)
-    status_2 = test_db.get_current_status(episode_id_2)
+    statuses = test_db.get_statuses_bulk([episode_id_1, episode_id_2])
 
-    assert status_1 == 'failed'
-    assert status_2 == 'completed'
+    assert statuses == {episode_id_1: 'failed', episode_id_2: 'completed'}
 
     # This demonstrates that failures are isolated
     # In the orchestrator, each episode is processed in a try-except block
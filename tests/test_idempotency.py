@@ -6,24 +6,21 @@ As described in PLAN_MASTERPLAN.md:
 - Email already sent (in email_log) → don't re-send
 """
 
+import sqlite3
 import pytest
 
 
-def test_episode_guid_deduplication(test_db, sample_episode_data):
+def test_episode_guid_deduplication(test_db, seeded_episode, sample_episode_data):
     """Test that episodes are deduplicated by GUID."""
-    # Create podcast
-    test_db.sync_podcasts([{'slug': 'test-podcast', 'active': True}])
-    podcast = test_db.get_podcast_by_slug('test-podcast')
-
-    # Insert episode first time
-    episode_id_1 = test_db.insert_episode(podcast['id'], sample_episode_data)
+    # Create podcast and insert episode first time
+    podcast, episode_id_1 = seeded_episode
     assert episode_id_1 > 0
 
     # Check episode exists
     assert test_db.episode_exists(sample_episode_data['guid']) is True
 
     # Try to insert same episode again (should fail due to unique GUID constraint)
-    with pytest.raises(Exception):  # Should raise sqlite3.IntegrityError
+    with pytest.raises(sqlite3.IntegrityError, match="UNIQUE constraint failed: episodes.episode_guid"):
         test_db.insert_episode(podcast['id'], sample_episode_data)
 
     # Verify only one episode exists
@@ -32,12 +29,10 @@ def test_episode_guid_deduplication(test_db, sample_episode_data):
     assert episode['id'] == episode_id_1
 
 
-def test_processing_log_prevents_reprocessing(test_db, sample_episode_data):
+def test_processing_log_prevents_reprocessing(test_db, seeded_episode):
     """Test that episodes already in processing_events are not reprocessed."""
     # Create podcast and episode
-    test_db.sync_podcasts([{'slug': 'test-podcast', 'active': True}])
-    podcast = test_db.get_podcast_by_slug('test-podcast')
-    episode_id = test_db.insert_episode(podcast['id'], sample_episode_data)
+    _, episode_id = seeded_episode
 
     # Check processing status (should be None initially)
     current_status = test_db.get_current_status(episode_id)
@@ -74,12 +69,10 @@ def test_processing_log_prevents_reprocessing(test_db, sample_episode_data):
     assert skip_processing is True
 
 
-def test_email_deduplication(test_db, sample_episode_data):
+def test_email_deduplication(test_db, seeded_episode):
     """Test that emails are not sent twice to same recipient."""
     # Create podcast and episode
-    test_db.sync_podcasts([{'slug': 'test-podcast', 'active': True}])
-    podcast = test_db.get_podcast_by_slug('test-podcast')
-    episode_id = test_db.insert_episode(podcast['id'], sample_episode_data)
+    _, episode_id = seeded_episode
 
     recipient = 'test@example.com'
 
@@ -102,3 +95,20 @@ def test_email_deduplication(test_db, sample_episode_data):
 
     # Verify still only one log entry
     assert test_db.email_already_sent(episode_id, recipient) is True
+
+
+def test_feed_validators_roundtrip(test_db):
+    """Test that feed cache validators are stored and replaced per URL."""
+    rss_url = 'https://example.com/feed.xml'
+
+    assert test_db.get_feed_validators(rss_url) is None
+
+    test_db.update_feed_validators(rss_url, '"v1"', 'Mon, 06 Jan 2025 10:00:00 GMT')
+    test_db.update_feed_validators(rss_url, '"v2"', None)
+
+    assert test_db.get_feed_validators(rss_url) == {
+        'etag': '"v2"', 'last_modified': None, 'config_hash': None
+    }
+
+    test_db.update_feed_validators(rss_url, '"v3"', None, config_hash='abc123')
+    assert test_db.get_feed_validators(rss_url)['config_hash'] == 'abc123'
@@ -0,0 +1,33 @@
+"""Tests for client-side LLM rate limiting."""
+
+from src.llm.rate_limiter import TokenBucket, RateLimiter, get_rate_limiter
+
+
+def test_token_bucket_allows_burst_then_waits():
+    """Test that the bucket allows a full burst, then asks callers to wait."""
+    bucket = TokenBucket(rate_per_minute=60)
+
+    # Full capacity is available immediately
+    assert bucket.reserve(60) == 0.0
+
+    # Next unit must wait roughly one second (60/min refill rate)
+    wait = bucket.reserve(1)
+    assert 0.9 < wait <= 1.0
+
+
+def test_rate_limiter_uses_largest_wait():
+    """Test that the token limit applies even when requests are under limit."""
+    limiter = RateLimiter(requests_per_minute=100, tokens_per_minute=1000)
+
+    assert limiter._reserve(1000) == 0.0
+    # Request bucket has room, token bucket is exhausted
+    assert limiter._reserve(500) > 25
+
+
+def test_shared_rate_limiter():
+    """Test that providers for the same model share one limiter."""
+    assert get_rate_limiter("gemini:test-model") is None
+
+    first = get_rate_limiter("gemini:test-model", requests_per_minute=10)
+    second = get_rate_limiter("gemini:test-model", requests_per_minute=10)
+    assert first is second